@@ -6,11 +6,34 @@ Run: python3 dashboard/server.py
 Open: http://localhost:8765
 """
 
+import functools
+import gzip
+import hashlib
 import http.server
+import importlib.util
+import io
 import json
+import math
 import re
-from datetime import datetime, timezone
+import select
+import threading
+import time
+from datetime import date, datetime
+from email.utils import formatdate, parsedate_to_datetime
+from operator import itemgetter
 from pathlib import Path
+from sys import intern
+from urllib.parse import parse_qs, urlsplit
+
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson for faster /api responses
+    orjson = None
+
+try:
+    import zstandard
+except ImportError:  # optional: pip install zstandard to serve zstd to browsers that accept it
+    zstandard = None
 
 PORT = 8765
 WORKSPACE = Path.home() / ".openclaw" / "workspace"
@@ -28,7 +51,183 @@ H1B_REG_DEADLINE = datetime(2026, 3, 19, 12, 0) # Final registration deadline
 
 NO_AUTO_COMPANIES = {"openai", "databricks", "waymo"}
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
+# Responses smaller than this aren't worth compressing. Level 1 keeps most of
+# the size win on repetitive JSON for a fraction of the CPU of the default;
+# bodies that are cached and resent are compressed once at CACHED_GZIP_LEVEL.
+GZIP_MIN_BYTES = 1024
+GZIP_LEVEL = 1
+CACHED_GZIP_LEVEL = 6
+ZSTD_LEVEL = 3
+
+# Content-codings we can produce, most preferred first.
+CONTENT_CODINGS = ("zstd", "gzip") if zstandard is not None else ("gzip",)
+
+STAGE_ORDER = ("Applied", "Phone Screen", "Technical Interview",
+               "Take Home", "Onsite/Final", "Offer", "Rejected")
+_STAGE_ORDER_LC = tuple((s.lower(), s) for s in STAGE_ORDER)
+_PIPELINE_TEMPLATE = dict.fromkeys(STAGE_ORDER, 0)
+
+# Legacy tracker stage names -> current ones.
+STAGE_NORMALIZE = {"Confirmed": "Applied", "Discovered": "Applied",
+                   "Response": "Applied", "Technical": "Technical Interview",
+                   "Onsite": "Onsite/Final"}
+
+# A cron job whose runningAtMs is newer than this is shown as running.
+RUNNING_WINDOW_MS = 30 * 60 * 1000
+
+# Compiled once at import; these run per line in the parse loops.
+_ENTRY_RE = re.compile(r"^###\s+(.+?)\s*—\s*(.+)$")
+_DATE_PREFIX_RE = re.compile(r"^(\d{4}-\d{2}-\d{2})")
+_BOLD_COMPANY_RE = re.compile(r"\*\*(.+?)\*\*")
+# ATS slug (or bare domain) of a job URL. Each branch is a lookahead from the
+# start so the ATS hosts win over the generic domain wherever they appear, in
+# the order listed; "boards.greenhouse.io" also covers job-boards.greenhouse.io.
+_ATS_URL_RE = re.compile(
+    r"(?=.*?jobs\.ashbyhq\.com/(?P<ashby>[^/]+))"
+    r"|(?=.*?boards\.greenhouse\.io/(?P<greenhouse>[^/]+))"
+    r"|(?=.*?jobs\.lever\.co/(?P<lever>[^/]+))"
+    r"|(?=.*?https?://(?:www\.)?(?P<domain>[^/]+))",
+    re.I,
+)
+
+# One match per stripped line in each parser; the outer group that matched
+# (m.lastgroup) says what kind of line it was. Branch order is the old
+# if/elif order.
+_QUEUE_LINE_RE = re.compile(
+    r"(?P<section>## .*)"
+    r"|(?P<score>###\s+\[(\d+)\]\s+(.+?)\s*—\s*(.+))$"
+    r"|(?P<field>- \*\*(URL|Location|H-1B):\*\*\s*(.*))"
+    r"|(?P<no_auto>.*?(?:OPENAI LIMIT|Auto-Apply: NO|DATABRICKS))"
+)
+_TRACKER_LINE_RE = re.compile(
+    r"(?P<entry>###\s+(.+?)\s*—\s*(.+))$"
+    r"|(?P<field>- \*\*(Stage|Date Applied|Link):\*\*\s*(.*))"
+)
+_MANUAL_LINE_RE = re.compile(r"## (?:(?P<tier>TIER.*)|(?P<end>SKIP|Strategy))|(?P<item>- \[)")
+
+# `- **Key:** value` bullet labels -> dict keys, per file.
+_QUEUE_FIELDS = {"URL": "url", "Location": "location", "H-1B": "h1b"}
+_TRACKER_FIELDS = {"Stage": "stage", "Date Applied": "date_applied", "Link": "link"}
+
+READ_BUFFER = 1 << 16
+
+# Parsed file contents, reused until the underlying file's (mtime, size) changes.
+_PARSE_CACHE: dict = {}
+
+
+def _file_signature(path: Path):
+    """Return (mtime_ns, size) for path, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cached_parse(path: Path, parser):
+    """Return parser(path lines), re-parsing only when the file changed."""
+    sig = _file_signature(path)
+    key = (path, parser.__name__)
+    hit = _PARSE_CACHE.get(key)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    if sig is None:
+        result = parser(())
+    else:
+        with path.open("r", encoding="utf-8", buffering=READ_BUFFER) as f:
+            result = parser(f)
+    _PARSE_CACHE[key] = (sig, result)
+    return result
+
+
+# The server is threaded; file read-modify-write handlers must not interleave.
+_WRITE_LOCK = threading.Lock()
+
+
+def _serialized(fn):
+    """Run fn under the module write lock."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _WRITE_LOCK:
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def _join_lines(lines) -> str:
+    return "".join(lines)
+
+
+def read_dedup_text() -> str:
+    """dedup-index.md contents, re-read only when the file changed."""
+    return _cached_parse(DEDUP_FILE, _join_lines)
+
+
+def _dedup_url_set(lines) -> frozenset:
+    return frozenset(canonicalize_url(line.split(" | ", 1)[0]) for line in lines if " | " in line)
 
+
+def dedup_urls() -> frozenset:
+    """Canonical URLs of every dedup-index.md row, rebuilt only when the file changed."""
+    return _cached_parse(DEDUP_FILE, _dedup_url_set)
+
+
+# Largest POST body accepted; the dashboard only ever sends a few small fields.
+MAX_POST_BYTES = 64 * 1024
+
+# Cap on requests being handled at once; idle keep-alive connections don't count.
+MAX_CONCURRENT_REQUESTS = 8
+_REQUEST_SLOTS = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def _bounded(fn):
+    """Run a request handler while holding one of the request slots."""
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        with _REQUEST_SLOTS:
+            return fn(*args, **kwargs)
+    return wrapper
+
+
+def _cached_on(*paths):
+    """Memoize a zero-arg loader until any of `paths` changes on disk."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper():
+            sig = tuple(_file_signature(p) for p in paths)
+            hit = _PARSE_CACHE.get(fn.__name__)
+            if hit is not None and hit[0] == sig:
+                return hit[1]
+            result = fn()
+            _PARSE_CACHE[fn.__name__] = (sig, result)
+            return result
+        return wrapper
+    return decorator
+
+
+def dumps_bytes(data) -> bytes:
+    """Serialize data to UTF-8 JSON bytes, via orjson when installed."""
+    if orjson is not None:
+        return orjson.dumps(data)
+    return _JSON_ENCODER.encode(data).encode()
+
+
+def compress(body: bytes, coding: str, cached: bool = False) -> bytes:
+    """Encode body with one of CONTENT_CODINGS."""
+    if coding == "zstd":
+        return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(body)
+    return gzip.compress(body, compresslevel=CACHED_GZIP_LEVEL if cached else GZIP_LEVEL)
+
+
+def loads_bytes(raw: bytes):
+    """Parse UTF-8 JSON bytes (or a bytearray), via orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=8192)
 def canonicalize_url(url: str) -> str:
     """Normalize URLs for consistent matching across files."""
     u = (url or "").strip()
@@ -39,58 +238,63 @@ def canonicalize_url(url: str) -> str:
     return u.rstrip("/")
 
 
-def parse_queue(content: str) -> dict:
-    """Parse job-queue.md into pending and manual_apply lists."""
+def split_field(stripped: str) -> tuple:
+    """Split a stripped `- **Key:** value` line into (key, value); key is None otherwise."""
+    if not stripped.startswith("- **"):
+        return None, ""
+    end = stripped.find(":**", 4)
+    if end < 0:
+        return None, ""
+    return stripped[4:end], stripped[end + 3:].strip()
+
+
+def parse_queue(lines) -> dict:
+    """Parse job-queue.md lines into pending and manual_apply lists."""
     sections = {"pending": [], "manual_apply": []}
     current_section = None
     current_job = None
 
-    for line in content.split("\n"):
+    for line in lines:
         stripped = line.strip()
-        if stripped == "## PENDING (sorted by priority score, highest first)":
-            current_section = "pending"
-            continue
-        elif stripped.startswith("## ") and "DO NOT AUTO-APPLY" in stripped:
-            current_section = "pending_no_auto"
+        m = _QUEUE_LINE_RE.match(stripped)
+        if m is None:
             continue
-        elif stripped.startswith("## "):
-            if current_job:
-                target = "manual_apply" if current_job.get("no_auto") else current_job.get("_section", "pending")
-                if target in sections:
-                    sections[target].append(current_job)
-                current_job = None
-            current_section = None
+        kind = m.lastgroup
+        if kind == "section":
+            if stripped == "## PENDING (sorted by priority score, highest first)":
+                current_section = "pending"
+            elif "DO NOT AUTO-APPLY" in stripped:
+                current_section = "pending_no_auto"
+            else:
+                if current_job:
+                    target = "manual_apply" if current_job.get("no_auto") else current_job.get("_section", "pending")
+                    if target in sections:
+                        sections[target].append(current_job)
+                    current_job = None
+                current_section = None
             continue
 
         if current_section is None:
             continue
 
-        effective_section = "pending" if current_section == "pending_no_auto" else current_section
-
-        score_match = re.match(r"^###\s+\[(\d+)\]\s+(.+?)\s*—\s*(.+)$", stripped)
-        if score_match:
+        if kind == "score":
             if current_job:
                 target = "manual_apply" if current_job.get("no_auto") else current_job["_section"]
                 if target in sections:
                     sections[target].append(current_job)
             current_job = {
-                "_section": effective_section,
-                "score": int(score_match.group(1)),
-                "company": score_match.group(2).strip(),
-                "title": score_match.group(3).strip(),
+                "_section": "pending" if current_section == "pending_no_auto" else current_section,
+                "score": int(m.group(3)),
+                "company": intern(m.group(4).strip()),
+                "title": m.group(5).strip(),
                 "url": "", "location": "", "h1b": "",
                 "no_auto": current_section == "pending_no_auto",
             }
-            continue
-
-        if current_job:
-            if stripped.startswith("- **URL:**"):
-                current_job["url"] = stripped.split("**URL:**")[1].strip()
-            elif stripped.startswith("- **Location:**"):
-                current_job["location"] = stripped.split("**Location:**")[1].strip()
-            elif stripped.startswith("- **H-1B:**"):
-                current_job["h1b"] = stripped.split("**H-1B:**")[1].strip()
-            elif "OPENAI LIMIT" in stripped or "Auto-Apply: NO" in stripped or "DATABRICKS" in stripped:
+        elif current_job:
+            if kind == "field":
+                field = _QUEUE_FIELDS[m.group(7)]
+                current_job[field] = intern(m.group(8)) if field == "location" else m.group(8)
+            else:
                 current_job["no_auto"] = True
 
     if current_job:
@@ -115,13 +319,26 @@ def parse_queue(content: str) -> dict:
     return sections
 
 
-def parse_tracker(content: str) -> dict:
-    """Parse job-tracker.md for pipeline stages and entries."""
+@functools.lru_cache(maxsize=256)
+def pipeline_bucket(stage: str) -> str:
+    """Pipeline stage a normalized label counts toward ("" for none).
+
+    Non-canonical labels fall into the first stage whose name they contain
+    (e.g. "Final Phone Screen" -> "Phone Screen"); each label is scanned once.
+    """
+    if stage in STAGE_ORDER or not stage:
+        return stage
+    stage_lc = stage.lower()
+    return next((s for s_lc, s in _STAGE_ORDER_LC if s_lc in stage_lc), "")
+
+
+def parse_tracker(lines) -> dict:
+    """Parse job-tracker.md lines for pipeline stages and entries."""
     entries = []
     current_entry = None
     in_comment = False
 
-    for line in content.split("\n"):
+    for line in lines:
         stripped = line.strip()
         if "<!--" in stripped:
             in_comment = True
@@ -130,189 +347,178 @@ def parse_tracker(content: str) -> dict:
             continue
         if in_comment:
             continue
-        entry_match = re.match(r"^###\s+(.+?)\s*—\s*(.+)$", stripped)
-        if entry_match:
+        m = _TRACKER_LINE_RE.match(stripped)
+        if m is None:
+            continue
+        if m.lastgroup == "entry":
             if current_entry:
                 entries.append(current_entry)
             current_entry = {
-                "company": entry_match.group(1).strip(),
-                "title": entry_match.group(2).strip(),
+                "company": intern(m.group(2).strip()),
+                "title": m.group(3).strip(),
                 "stage": "", "date_applied": "", "link": "",
             }
-            continue
-
-        if current_entry:
-            if line.strip().startswith("- **Stage:**"):
-                current_entry["stage"] = line.split("**Stage:**")[1].strip()
-            elif line.strip().startswith("- **Date Applied:**"):
-                current_entry["date_applied"] = line.split("**Date Applied:**")[1].strip()
-            elif line.strip().startswith("- **Link:**"):
-                current_entry["link"] = line.split("**Link:**")[1].strip()
+        elif current_entry:
+            current_entry[_TRACKER_FIELDS[m.group(5)]] = m.group(6)
 
     if current_entry:
         entries.append(current_entry)
 
-    stage_order = ["Applied", "Phone Screen", "Technical Interview",
-                   "Take Home", "Onsite/Final", "Offer", "Rejected"]
-    # Normalize legacy stages
-    stage_normalize = {"Confirmed": "Applied", "Discovered": "Applied",
-                       "Response": "Applied", "Technical": "Technical Interview",
-                       "Onsite": "Onsite/Final"}
-    pipeline = {s: 0 for s in stage_order}
+    pipeline = _PIPELINE_TEMPLATE.copy()
     for e in entries:
-        stage = e.get("stage", "").strip()
-        # Clean up variants like "Applied (pending verification)"
-        if "(" in stage:
-            stage = stage.split("(")[0].strip()
-        stage = stage_normalize.get(stage, stage)
-        e["stage"] = stage  # Update entry in-place for downstream use
-        if stage in pipeline:
-            pipeline[stage] += 1
-        elif stage:
-            for s in stage_order:
-                if s.lower() in stage.lower():
-                    pipeline[s] += 1
-                    break
+        # Update entry in-place for downstream use
+        e["stage"] = stage = normalize_stage(e["stage"])
+        bucket = pipeline_bucket(stage)
+        if bucket:
+            pipeline[bucket] += 1
 
     return {"pipeline": pipeline, "entries": entries}
 
 
-STAGE_NORMALIZE = {"Confirmed": "Applied", "Discovered": "Applied",
-                   "Response": "Applied", "Technical": "Technical Interview",
-                   "Onsite": "Onsite/Final"}
-
-
 def normalize_stage(stage: str) -> str:
     """Normalize legacy stage names to current ones."""
     stage = stage.strip()
+    # Clean up variants like "Applied (pending verification)"
     if "(" in stage:
         stage = stage.split("(")[0].strip()
-    return STAGE_NORMALIZE.get(stage, stage)
+    return intern(STAGE_NORMALIZE.get(stage, stage))
 
 
-def sanitize_applied_date(raw: str) -> str:
-    """Clamp future dates to today; preserve non-date strings."""
+def sanitize_applied_date(raw: str, today: date = None) -> str:
+    """Clamp future dates to today; preserve non-date strings.
+
+    Callers sanitizing many values pass `today` once instead of reading the clock per call.
+    """
     value = (raw or "").strip()
     if not value:
         return ""
-    m = re.match(r"^(\d{4}-\d{2}-\d{2})", value)
+    m = _DATE_PREFIX_RE.match(value)
     if not m:
         return value
     try:
-        parsed = datetime.strptime(m.group(1), "%Y-%m-%d").date()
+        parsed = date.fromisoformat(m.group(1))
     except ValueError:
         return value
-    if parsed > datetime.now().date():
-        return datetime.now().strftime("%Y-%m-%d")
-    return value
+    if today is None:
+        today = date.today()
+    return today.isoformat() if parsed > today else value
 
 
+@_cached_on(TRACKER_FILE, DEDUP_FILE)
 def get_applied_jobs() -> list:
     """Get all applied jobs by merging dedup-index.md with tracker stages."""
-    # Build stage/date lookup from tracker
-    tracker_content = TRACKER_FILE.read_text() if TRACKER_FILE.exists() else ""
-    tracker_data = parse_tracker(tracker_content)
+    # Build stage/date lookup from tracker (stages already normalized by parse_tracker)
+    tracker_data = _cached_parse(TRACKER_FILE, parse_tracker)
+    today = date.today()
     stage_by_url = {}
     date_by_url = {}
+    tracker_rows = []  # (canonical url, link, entry, sanitized date), reused for the merge below
     for e in tracker_data["entries"]:
-        url_raw = e.get("link", "").strip()
+        url_raw = e["link"].strip()
         url = canonicalize_url(url_raw)
         if url:
-            stage_by_url[url] = normalize_stage(e.get("stage", "Applied"))
-            date_by_url[url] = sanitize_applied_date(e.get("date_applied", ""))
+            applied_on = sanitize_applied_date(e["date_applied"], today)
+            stage_by_url[url] = e["stage"]
+            date_by_url[url] = applied_on
+            tracker_rows.append((url, url_raw, e, applied_on))
 
-    # Parse dedup for all APPLIED entries
-    entries = []
-    seen_urls = set()
+    # Parse dedup for all APPLIED entries, keyed by canonical URL (first wins)
+    entries = {}
     if DEDUP_FILE.exists():
-        for line in DEDUP_FILE.read_text().split("\n"):
-            if "| APPLIED" not in line:
-                continue
-            parts = line.split(" | ")
-            if len(parts) < 4:
-                continue
-            url_raw = parts[0].strip()
-            url = canonicalize_url(url_raw)
-            if url in seen_urls:
-                continue
-            seen_urls.add(url)
-            company = parts[1].strip() if len(parts) > 1 else ""
-            title = parts[2].strip() if len(parts) > 2 else ""
-            date = sanitize_applied_date((parts[4].strip() if len(parts) > 4 else "") or date_by_url.get(url, ""))
-            stage = stage_by_url.get(url, "Applied")
-            entries.append({
-                "url": url_raw, "company": company, "title": title,
-                "date": date, "stage": stage,
-            })
+        # Scan raw bytes; only APPLIED rows are worth decoding.
+        with DEDUP_FILE.open("rb", buffering=READ_BUFFER) as f:
+            for raw in f:
+                if b"| APPLIED" not in raw:
+                    continue
+                parts = raw.decode("utf-8").split(" | ")
+                if len(parts) < 4:
+                    continue
+                url_raw = parts[0].strip()
+                url = canonicalize_url(url_raw)
+                if url in entries:
+                    continue
+                logged = parts[4].strip() if len(parts) > 4 else ""
+                entries[url] = {
+                    "url": url_raw, "company": intern(parts[1].strip()), "title": parts[2].strip(),
+                    "date": sanitize_applied_date(logged, today) if logged else date_by_url.get(url, ""),
+                    "stage": stage_by_url.get(url, "Applied"),
+                }
 
     # Also include tracker entries not in dedup
-    for e in tracker_data["entries"]:
-        url = e.get("link", "").strip()
-        url_key = canonicalize_url(url)
-        if url and url_key and url_key not in seen_urls:
-            seen_urls.add(url_key)
-            entries.append({
-                "url": url, "company": e["company"], "title": e["title"],
-                "date": sanitize_applied_date(e.get("date_applied", "")), "stage": normalize_stage(e.get("stage", "Applied")),
-            })
+    for url, url_raw, e, applied_on in tracker_rows:
+        if url not in entries:
+            entries[url] = {
+                "url": url_raw, "company": e["company"], "title": e["title"],
+                "date": applied_on, "stage": e["stage"],
+            }
 
-    entries.sort(key=lambda x: x.get("date", ""), reverse=True)
-    return entries
+    return sorted(entries.values(), key=itemgetter("date"), reverse=True)
 
 
+@_cached_on(MANUAL_APPLY_FILE)
 def parse_manual_apply() -> list:
     """Parse manual-apply-priority.md into entries for Manual Apply tab."""
     if not MANUAL_APPLY_FILE.exists():
         return []
-    content = MANUAL_APPLY_FILE.read_text()
     entries = []
     current_tier = ""
-    for line in content.split("\n"):
-        stripped = line.strip()
-        if stripped.startswith("## TIER"):
-            current_tier = stripped.split("—")[0].replace("## ", "").strip() if "—" in stripped else stripped.replace("## ", "").strip()
-            continue
-        if stripped.startswith("## SKIP") or stripped.startswith("## Strategy"):
-            current_tier = ""
-            continue
-        if not current_tier or not stripped.startswith("- ["):
-            continue
-        checked = "[x]" in stripped
-        if checked:
-            continue  # Already applied, skip from manual list
-        rest = stripped.split("] ", 1)[1] if "] " in stripped else ""
-        company_match = re.match(r"\*\*(.+?)\*\*", rest)
-        if not company_match:
-            continue
-        company = company_match.group(1)
-        after_company = rest[company_match.end():].strip()
-        parts = after_company.split(" — ", 1) if " — " in after_company else [after_company, ""]
-        description = parts[0].strip().lstrip("— ") if parts[0] else ""
-        url = parts[1].strip() if len(parts) > 1 else ""
-        entries.append({
-            "score": 0, "company": company,
-            "title": description or "See careers page",
-            "url": url, "location": current_tier,
-            "h1b": "", "no_auto": True,
-        })
+    with MANUAL_APPLY_FILE.open("r", encoding="utf-8", buffering=READ_BUFFER) as f:
+        for line in f:
+            stripped = line.strip()
+            m = _MANUAL_LINE_RE.match(stripped)
+            if m is None:
+                continue
+            kind = m.lastgroup
+            if kind == "tier":
+                current_tier = m.group("tier").split("—")[0].replace("## ", "").strip()
+                continue
+            if kind == "end":
+                current_tier = ""
+                continue
+            if not current_tier:
+                continue
+            checked = "[x]" in stripped
+            if checked:
+                continue  # Already applied, skip from manual list
+            rest = stripped.split("] ", 1)[1] if "] " in stripped else ""
+            company_match = _BOLD_COMPANY_RE.match(rest)
+            if not company_match:
+                continue
+            company = company_match.group(1)
+            after_company = rest[company_match.end():].strip()
+            parts = after_company.split(" — ", 1) if " — " in after_company else [after_company, ""]
+            description = parts[0].strip().lstrip("— ") if parts[0] else ""
+            url = parts[1].strip() if len(parts) > 1 else ""
+            entries.append({
+                "score": 0, "company": company,
+                "title": description or "See careers page",
+                "url": url, "location": current_tier,
+                "h1b": "", "no_auto": True,
+            })
     return entries
 
 
+@_cached_on(JOBS_JSON)
+def load_jobs_json() -> dict:
+    """Load cron/jobs.json (cached until the file changes)."""
+    return loads_bytes(JOBS_JSON.read_bytes())
+
+
 def get_agent_status() -> list:
     """Get agent status from jobs.json."""
     try:
-        with open(JOBS_JSON, 'r') as f:
-            data = json.load(f)
+        data = load_jobs_json()
         agents = []
-        now_ms = int(datetime.now(timezone.utc).timestamp() * 1000)
+        now_ms = time.time_ns() // 1_000_000
+        running_after_ms = now_ms - RUNNING_WINDOW_MS
         for job in data.get("jobs", []):
             if not job.get("enabled", True):
                 continue
-            state = job.get("state", {})
+            state = job.get("state") or {}
             running_ms = state.get("runningAtMs", 0)
             last_status = state.get("lastStatus", "")
             errors = state.get("consecutiveErrors", 0)
-            if running_ms and (now_ms - running_ms) < 1800000:
+            if running_ms and running_ms > running_after_ms:
                 status = "running"
             elif last_status == "error":
                 status = "error"
@@ -326,13 +532,73 @@ def get_agent_status() -> list:
         return []
 
 
+@_cached_on(DEDUP_FILE)
 def count_dedup_applied() -> int:
     """Count APPLIED entries in dedup-index.md."""
     if not DEDUP_FILE.exists():
         return 0
-    return DEDUP_FILE.read_text().count("| APPLIED")
+    return DEDUP_FILE.read_bytes().count(b"| APPLIED")
+
+
+# `url | company | title | PENDING[ | date]` rows of dedup-index.md
+_PENDING_DEDUP_ROW_RE = re.compile(r"^([^|\n]*?) \| ([^|\n]*) \| ([^|\n]*) \| PENDING(?: \|[^\n]*)?$", re.M)
+
+
+def _resolve_pending_dedup(content: str, url: str, status: str, today: str) -> tuple:
+    """Flip this URL's PENDING dedup rows to status/today with one regex pass.
 
+    Rows match on canonical URL, the same key dedup_urls() is built from, so
+    a URL counted as present always reaches its row. Returns (new content,
+    rows changed).
+    """
+    key = canonicalize_url(url)
+    changed = 0
 
+    def flip(m):
+        nonlocal changed
+        if canonicalize_url(m.group(1)) != key:
+            return m.group(0)
+        changed += 1
+        return f"{m.group(1)} | {m.group(2)} | {m.group(3)} | {status} | {today}"
+
+    return _PENDING_DEDUP_ROW_RE.sub(flip, content), changed
+
+
+def _drop_queue_blocks(lines: list, needles: tuple) -> tuple:
+    """Drop every `### ` job block containing any of needles, in one pass.
+
+    A block runs from its `### ` heading to the next `### ` or `## ` line.
+    Returns (kept lines, whether anything was dropped).
+    """
+    out = []
+    block = None
+    hit = removed = False
+    for line in lines:
+        if line.startswith("### ") or line.startswith("## "):
+            if block is not None:
+                if hit:
+                    removed = True
+                else:
+                    out.extend(block)
+                block = None
+            if line.startswith("### "):
+                block = [line]
+                hit = any(n in line for n in needles)
+                continue
+        elif block is not None:
+            block.append(line)
+            hit = hit or any(n in line for n in needles)
+            continue
+        out.append(line)
+    if block is not None:
+        if hit:
+            removed = True
+        else:
+            out.extend(block)
+    return out, removed
+
+
+@_serialized
 def mark_as_applied(url: str, company: str = "", title: str = "") -> dict:
     """Mark a job as applied: update queue, dedup, and tracker."""
     url = url.strip()
@@ -340,61 +606,30 @@ def mark_as_applied(url: str, company: str = "", title: str = "") -> dict:
         return {"ok": False, "error": "URL is required"}
 
     today = datetime.now().strftime("%Y-%m-%d")
+    url_base = url.replace("/application", "")
 
     # 1. Update dedup-index.md
     if DEDUP_FILE.exists():
-        dedup_content = DEDUP_FILE.read_text()
-        url_base = url.replace("/application", "")
-        if url not in dedup_content and url_base not in dedup_content:
+        if canonicalize_url(url) not in dedup_urls():
             with open(DEDUP_FILE, "a") as f:
                 f.write(f"{url} | {company or 'Manual'} | {title or 'Manual entry'} | APPLIED | {today}\n")
         else:
-            lines = dedup_content.split("\n")
-            updated = False
-            for i, line in enumerate(lines):
-                if (url in line or url_base in line) and "PENDING" in line:
-                    parts = line.split(" | ")
-                    if len(parts) >= 4:
-                        parts[3] = "APPLIED"
-                    if len(parts) >= 5:
-                        parts[4] = f" {today}"
-                    else:
-                        parts.append(f" {today}")
-                    lines[i] = " | ".join(parts)
-                    updated = True
+            dedup_content, updated = _resolve_pending_dedup(read_dedup_text(), url, "APPLIED", today)
             if updated:
-                DEDUP_FILE.write_text("\n".join(lines))
+                DEDUP_FILE.write_text(dedup_content)
     else:
         DEDUP_FILE.write_text(f"# Dedup Index\n{url} | {company or 'Manual'} | {title or 'Manual entry'} | APPLIED | {today}\n")
 
     # 2. Remove from pending in job-queue.md
     if QUEUE_FILE.exists():
-        content = QUEUE_FILE.read_text()
-        lines = content.split("\n")
-        url_variants = [url, url + "/application", url.replace("/application", "")]
-        i = 0
-        removed = False
-        while i < len(lines):
-            if lines[i].startswith("### "):
-                block_start = i
-                block_end = i + 1
-                while block_end < len(lines) and not lines[block_end].startswith("### ") and not lines[block_end].startswith("## "):
-                    block_end += 1
-                block = "\n".join(lines[block_start:block_end])
-                if any(v in block for v in url_variants):
-                    del lines[block_start:block_end]
-                    removed = True
-                    continue
-                i = block_end
-            else:
-                i += 1
+        # url + "/application" contains url, so two needles cover all three variants.
+        lines, removed = _drop_queue_blocks(QUEUE_FILE.read_text().split("\n"), (url, url_base))
         if removed:
             QUEUE_FILE.write_text("\n".join(lines))
 
     # 3. Add to job-tracker.md
     if TRACKER_FILE.exists():
-        tracker_content = TRACKER_FILE.read_text()
-        url_base = url.replace("/application", "")
+        tracker_content = _cached_parse(TRACKER_FILE, index_tracker_lines)["content"]
         if url not in tracker_content and url_base not in tracker_content:
             entry = f"\n### {company or 'Manual'} — {title or 'Manual Entry'}\n"
             entry += f"- **Stage:** Applied\n"
@@ -402,17 +637,18 @@ def mark_as_applied(url: str, company: str = "", title: str = "") -> dict:
             entry += f"- **Source:** Manual (Howard applied directly)\n"
             entry += f"- **Link:** {url}\n"
             entry += f"- **Notes:** Manually marked as applied via dashboard\n"
-            if "## Priority Follow-ups" in tracker_content:
-                tracker_content = tracker_content.replace(
-                    "## Priority Follow-ups", entry + "\n## Priority Follow-ups"
-                )
+            head, marker, tail = tracker_content.partition("## Priority Follow-ups")
+            if marker:
+                TRACKER_FILE.write_text(head + entry + "\n" + marker + tail)
             else:
-                tracker_content += entry
-            TRACKER_FILE.write_text(tracker_content)
+                # Nothing to insert before: append instead of rewriting the file.
+                with open(TRACKER_FILE, "a") as f:
+                    f.write(entry)
 
     return {"ok": True, "message": f"Marked {company or 'job'} — {title or 'unknown'} as applied"}
 
 
+@_serialized
 def delete_from_queue(url: str, company: str = "", title: str = "") -> dict:
     """Delete a job from queue and add to dedup as SKIPPED to prevent re-discovery."""
     url = url.strip()
@@ -420,80 +656,59 @@ def delete_from_queue(url: str, company: str = "", title: str = "") -> dict:
         return {"ok": False, "error": "URL is required"}
 
     today = datetime.now().strftime("%Y-%m-%d")
+    url_base = url.replace("/application", "")
 
     # 1. Add/update dedup-index.md as SKIPPED
     if DEDUP_FILE.exists():
-        dedup_content = DEDUP_FILE.read_text()
-        url_base = url.replace("/application", "")
-        if url not in dedup_content and url_base not in dedup_content:
+        if canonicalize_url(url) not in dedup_urls():
             with open(DEDUP_FILE, "a") as f:
                 f.write(f"{url} | {company or 'Unknown'} | {title or 'Deleted'} | SKIPPED | {today}\n")
         else:
-            lines = dedup_content.split("\n")
-            updated = False
-            for i, line in enumerate(lines):
-                if (url in line or url_base in line) and "PENDING" in line:
-                    parts = line.split(" | ")
-                    if len(parts) >= 4:
-                        parts[3] = "SKIPPED"
-                    if len(parts) >= 5:
-                        parts[4] = f" {today}"
-                    else:
-                        parts.append(f" {today}")
-                    lines[i] = " | ".join(parts)
-                    updated = True
+            dedup_content, updated = _resolve_pending_dedup(read_dedup_text(), url, "SKIPPED", today)
             if updated:
-                DEDUP_FILE.write_text("\n".join(lines))
+                DEDUP_FILE.write_text(dedup_content)
     else:
         DEDUP_FILE.write_text(f"# Dedup Index\n{url} | {company or 'Unknown'} | {title or 'Deleted'} | SKIPPED | {today}\n")
 
     # 2. Remove from pending in job-queue.md
     if QUEUE_FILE.exists():
-        content = QUEUE_FILE.read_text()
-        lines = content.split("\n")
-        url_variants = [url, url + "/application", url.replace("/application", "")]
-        i = 0
-        removed = False
-        while i < len(lines):
-            if lines[i].startswith("### "):
-                block_start = i
-                block_end = i + 1
-                while block_end < len(lines) and not lines[block_end].startswith("### ") and not lines[block_end].startswith("## "):
-                    block_end += 1
-                block = "\n".join(lines[block_start:block_end])
-                if any(v in block for v in url_variants):
-                    del lines[block_start:block_end]
-                    removed = True
-                    continue
-                i = block_end
-            else:
-                i += 1
+        # url + "/application" contains url, so two needles cover all three variants.
+        lines, removed = _drop_queue_blocks(QUEUE_FILE.read_text().split("\n"), (url, url_base))
         if removed:
             QUEUE_FILE.write_text("\n".join(lines))
 
     return {"ok": True, "message": f"Deleted {company or 'job'} — {title or 'unknown'} (added to dedup as SKIPPED)"}
 
 
-def update_stage(search_term: str, new_stage: str, url: str = "", company: str = "", title: str = "") -> dict:
-    """Update a job's stage in the tracker. Searches by company name or URL."""
-    valid_stages = ["Applied", "Phone Screen", "Technical Interview",
-                    "Take Home", "Onsite/Final", "Offer", "Rejected"]
-    if new_stage not in valid_stages:
-        return {"ok": False, "error": f"Invalid stage. Valid: {', '.join(valid_stages)}"}
-
-    if not TRACKER_FILE.exists():
-        return {"ok": False, "error": "Tracker file not found"}
-
-    content = TRACKER_FILE.read_text()
-    lines = content.split('\n')
-    search_lower = search_term.lower().strip()
-    target_url = canonicalize_url(url or search_term)
-
-    # Parse entries with line positions
+def _rewrite_stage_lines(lines: list, targets: list, new_stage: str) -> str:
+    """Join tracker lines in one pass, setting (or inserting) each target's Stage line."""
+    stage_line = f"- **Stage:** {new_stage}"
+    replace_at = {e["stage_line"] for e in targets if e["stage_line"] is not None}
+    insert_after = {e["heading_line"] for e in targets if e["stage_line"] is None}
+    buf = io.StringIO()
+    for i, line in enumerate(lines):
+        if i:
+            buf.write("\n")
+        buf.write(stage_line if i in replace_at else line)
+        if i in insert_after:
+            buf.write("\n")
+            buf.write(stage_line)
+    return buf.getvalue()
+
+
+def index_tracker_lines(lines) -> dict:
+    """Split job-tracker.md into lines and locate each entry's heading/Stage line.
+
+    Entries carry a lower-cased "search" string, and by_url groups them by
+    canonical link, so update_stage does no per-call string building.
+    """
+    content = "".join(lines)
+    lines = content.split("\n")
     entries = []
     current = None
     for i, line in enumerate(lines):
-        entry_match = re.match(r'^###\s+(.+?)\s*—\s*(.+)$', line.strip())
+        stripped = line.strip()
+        entry_match = _ENTRY_RE.match(stripped)
         if entry_match:
             if current:
                 entries.append(current)
@@ -504,29 +719,43 @@ def update_stage(search_term: str, new_stage: str, url: str = "", company: str =
             }
             continue
         if current:
-            if line.strip().startswith('- **Stage:**'):
+            key, value = split_field(stripped)
+            if key == "Stage":
                 current["stage_line"] = i
-            elif line.strip().startswith('- **Link:**'):
-                current["link"] = line.split('**Link:**')[1].strip()
+            elif key == "Link":
+                current["link"] = value
     if current:
         entries.append(current)
 
-    # Find match by company, title, or URL
-    match = None
-    url_matches = []
-    if target_url:
-        for e in entries:
-            if canonicalize_url(e.get("link", "")) == target_url:
-                url_matches.append(e)
-        if url_matches:
-            match = url_matches[0]
+    by_url = {}
     for e in entries:
-        if match:
-            break
-        searchable = f"{e['company']} {e['title']} {e['link']}".lower()
-        if search_lower in searchable:
-            match = e
-            break
+        e["search"] = f"{e['company']} {e['title']} {e['link']}".lower()
+        by_url.setdefault(canonicalize_url(e["link"]), []).append(e)
+    return {"content": content, "lines": lines, "entries": entries, "by_url": by_url}
+
+
+@_serialized
+def update_stage(search_term: str, new_stage: str, url: str = "", company: str = "", title: str = "") -> dict:
+    """Update a job's stage in the tracker. Searches by company name or URL."""
+    valid_stages = ["Applied", "Phone Screen", "Technical Interview",
+                    "Take Home", "Onsite/Final", "Offer", "Rejected"]
+    if new_stage not in valid_stages:
+        return {"ok": False, "error": f"Invalid stage. Valid: {', '.join(valid_stages)}"}
+
+    if not TRACKER_FILE.exists():
+        return {"ok": False, "error": "Tracker file not found"}
+
+    tracker = _cached_parse(TRACKER_FILE, index_tracker_lines)
+    content, lines = tracker["content"], tracker["lines"]
+    search_lower = search_term.lower().strip()
+    target_url = canonicalize_url(url or search_term)
+
+    # Find match by URL, falling back to the first company/title/link substring hit
+    url_matches = tracker["by_url"].get(target_url, []) if target_url else []
+    if url_matches:
+        match = url_matches[0]
+    else:
+        match = next((e for e in tracker["entries"] if search_lower in e["search"]), None)
 
     if not match:
         # Dedup-only applied jobs can appear in dashboard without tracker rows yet.
@@ -543,22 +772,19 @@ def update_stage(search_term: str, new_stage: str, url: str = "", company: str =
             "- **Source:** Dashboard stage update (tracker backfill)",
             f"- **Link:** {safe_url}",
         ]
-        TRACKER_FILE.write_text(content.rstrip() + "\n" + "\n".join(entry) + "\n")
+        body = content.rstrip()
+        if content == body + "\n":
+            # Already ends in exactly one newline: appending gives the same file.
+            with open(TRACKER_FILE, "a") as f:
+                f.write("\n".join(entry) + "\n")
+        else:
+            TRACKER_FILE.write_text(body + "\n" + "\n".join(entry) + "\n")
         return {"ok": True, "message": f"{safe_company} — {safe_title}: created tracker entry -> {new_stage}"}
 
     if url_matches:
-        changed = 0
-        inserted = 0
-        # Update from bottom to top so line inserts don't shift upcoming indexes.
-        for e in sorted(url_matches, key=lambda x: x["heading_line"], reverse=True):
-            if e["stage_line"] is None:
-                insert_at = e["heading_line"] + 1
-                lines.insert(insert_at, f"- **Stage:** {new_stage}")
-                inserted += 1
-            else:
-                lines[e["stage_line"]] = f'- **Stage:** {new_stage}'
-                changed += 1
-        TRACKER_FILE.write_text('\n'.join(lines))
+        inserted = sum(1 for e in url_matches if e["stage_line"] is None)
+        changed = len(url_matches) - inserted
+        TRACKER_FILE.write_text(_rewrite_stage_lines(lines, url_matches, new_stage))
         label = f"{match['company']} — {match['title']}"
         details = f"updated {changed}"
         if inserted:
@@ -566,48 +792,67 @@ def update_stage(search_term: str, new_stage: str, url: str = "", company: str =
         return {"ok": True, "message": f"{label}: {details} tracker row(s) -> {new_stage}"}
 
     if match["stage_line"] is None:
-        insert_at = match["heading_line"] + 1
-        lines.insert(insert_at, f"- **Stage:** {new_stage}")
-        TRACKER_FILE.write_text('\n'.join(lines))
+        TRACKER_FILE.write_text(_rewrite_stage_lines(lines, [match], new_stage))
         return {"ok": True, "message": f"{match['company']} — {match['title']}: (missing stage) -> {new_stage}"}
 
     old_stage = lines[match["stage_line"]].split('**Stage:**')[1].strip()
-    lines[match["stage_line"]] = f'- **Stage:** {new_stage}'
-    TRACKER_FILE.write_text('\n'.join(lines))
+    TRACKER_FILE.write_text(_rewrite_stage_lines(lines, [match], new_stage))
     return {"ok": True, "message": f"{match['company']} — {match['title']}: {old_stage} -> {new_stage}"}
 
 
 SCRIPTS_DIR = WORKSPACE / "scripts"
+PREFLIGHT_SCRIPT = SCRIPTS_DIR / "preflight-check.py"
+
+
+@_cached_on(PREFLIGHT_SCRIPT)
+def load_preflight():
+    """Import scripts/preflight-check.py in-process (re-imported when the file changes)."""
+    spec = importlib.util.spec_from_file_location("preflight_check", PREFLIGHT_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+# Overall wall-clock budget for one preflight check; urlopen's timeouts are per
+# socket operation, so a slow board could otherwise hold the request for minutes.
+PREFLIGHT_TIMEOUT = 15
+
+
+def run_preflight(url: str):
+    """Run check_url(url) under PREFLIGHT_TIMEOUT.
+
+    Returns (status, reason), or None if the check failed or ran out of time.
+    An abandoned check finishes in its daemon thread without holding a
+    request slot.
+    """
+    result = []
+
+    def check():
+        try:
+            result.append(load_preflight().check_url(url))
+        except Exception:
+            pass
+
+    worker = threading.Thread(target=check, name="preflight", daemon=True)
+    worker.start()
+    worker.join(PREFLIGHT_TIMEOUT)
+    return result[0] if result else None
 
 
 def extract_from_url(url: str) -> dict:
     """Extract company and ATS type from a job URL."""
     info = {"company": "", "title": "", "ats": ""}
-    url_lower = url.lower()
-    # Ashby
-    m = re.search(r"jobs\.ashbyhq\.com/([^/]+)", url_lower)
-    if m:
-        info["company"] = m.group(1).replace("-", " ").title()
-        info["ats"] = "ashby"
-        return info
-    # Greenhouse
-    m = re.search(r"boards\.greenhouse\.io/([^/]+)", url_lower)
-    if not m:
-        m = re.search(r"job-boards\.greenhouse\.io/([^/]+)", url_lower)
-    if m:
-        info["company"] = m.group(1).replace("-", " ").title()
-        info["ats"] = "greenhouse"
-        return info
-    # Lever
-    m = re.search(r"jobs\.lever\.co/([^/]+)", url_lower)
-    if m:
-        info["company"] = m.group(1).replace("-", " ").title()
-        info["ats"] = "lever"
+    m = _ATS_URL_RE.match(url)
+    if m is None:
         return info
-    # Generic: use domain
-    m = re.search(r"https?://(?:www\.)?([^/]+)", url_lower)
-    if m:
-        info["company"] = m.group(1).split(".")[0].replace("-", " ").title()
+    kind = m.lastgroup
+    slug = m.group(kind)
+    if kind == "domain":
+        # Generic: use domain
+        slug = slug.split(".")[0]
+    else:
+        info["ats"] = kind
+    info["company"] = slug.replace("-", " ").title()
     return info
 
 
@@ -622,27 +867,17 @@ def add_job(url: str, destination: str = "queue") -> dict:
     company = info["company"]
 
     # Check dedup first
-    if DEDUP_FILE.exists():
-        dedup_content = DEDUP_FILE.read_text()
-        url_base = url.replace("/application", "")
-        if url in dedup_content or url_base in dedup_content:
-            return {"ok": False, "error": f"Already in system (dedup hit)"}
+    if canonicalize_url(url) in dedup_urls():
+        return {"ok": False, "error": f"Already in system (dedup hit)"}
 
     if destination == "applied":
         return mark_as_applied(url, company, "Manual entry")
 
-    # Run preflight check
-    preflight = SCRIPTS_DIR / "preflight-check.py"
-    try:
-        result = subprocess.run(
-            ["python3", str(preflight), url],
-            capture_output=True, text=True, timeout=15
-        )
-        output = result.stdout.strip()
-        if output.startswith("DEAD"):
-            return {"ok": False, "error": f"Job posting is dead: {output}"}
-    except Exception:
-        pass  # Preflight failure is non-blocking
+    # Run preflight check (in-process; failure or timeout is non-blocking)
+    checked = run_preflight(url)
+    if checked and checked[0] == "DEAD":
+        status, reason = checked
+        return {"ok": False, "error": f"Job posting is dead: {status} {reason}"}
 
     # Add to queue via add-to-queue.py
     add_script = SCRIPTS_DIR / "add-to-queue.py"
@@ -670,16 +905,17 @@ def add_job(url: str, destination: str = "queue") -> dict:
         return {"ok": False, "error": str(e)}
 
 
+@_cached_on(SKIP_LIST_FILE)
 def get_skip_list() -> list:
-    """Get the skip companies list."""
+    """Get the skip companies list (cached until the file changes)."""
     try:
-        with open(SKIP_LIST_FILE, 'r') as f:
-            data = json.load(f)
+        data = loads_bytes(SKIP_LIST_FILE.read_bytes())
         return data.get("companies", [])
     except (FileNotFoundError, json.JSONDecodeError):
         return []
 
 
+@_serialized
 def add_to_skip_list(name: str, reason: str, category: str = "manual") -> dict:
     """Add a company to the skip list."""
     name = name.strip()
@@ -700,6 +936,7 @@ def add_to_skip_list(name: str, reason: str, category: str = "manual") -> dict:
     return {"ok": True, "message": f"Added {name} to skip list"}
 
 
+@_serialized
 def remove_from_skip_list(name: str) -> dict:
     """Remove a company from the skip list."""
     try:
@@ -716,45 +953,220 @@ def remove_from_skip_list(name: str) -> dict:
     return {"ok": True, "message": f"Removed {name} from skip list"}
 
 
-def build_api_response() -> dict:
-    """Build full dashboard data."""
-    queue_content = QUEUE_FILE.read_text() if QUEUE_FILE.exists() else ""
-    queue_sections = parse_queue(queue_content)
+# Row fields of each job list in /api/data. Lists go over the wire as columns
+# ({field: [values...]}) so the keys aren't repeated for every job.
+QUEUE_COLUMNS = ("score", "company", "title", "url", "location", "h1b", "no_auto")
+APPLIED_COLUMNS = ("url", "company", "title", "date", "stage")
+
+
+def to_columns(rows: list, fields: tuple) -> dict:
+    """Transpose a list of row dicts into {field: [value per row]}."""
+    return {f: [row[f] for row in rows] for f in fields}
 
-    # Merge manual-apply-priority.md entries
-    manual_entries = parse_manual_apply()
-    queue_sections["manual_apply"].extend(manual_entries)
 
-    applied_jobs = get_applied_jobs()
-    agents = get_agent_status()
-    dedup_applied = count_dedup_applied()
+# Every file that feeds /api/data.
+DATA_SOURCES = (QUEUE_FILE, TRACKER_FILE, DEDUP_FILE, MANUAL_APPLY_FILE, JOBS_JSON, SKIP_LIST_FILE)
+# The ones behind the job lists (the agent schedule only feeds the summary).
+LIST_SOURCES = (QUEUE_FILE, TRACKER_FILE, DEDUP_FILE, MANUAL_APPLY_FILE, SKIP_LIST_FILE)
 
-    # Pipeline from tracker
-    tracker_content = TRACKER_FILE.read_text() if TRACKER_FILE.exists() else ""
-    tracker_data = parse_tracker(tracker_content)
 
-    now = datetime.now()
-    import math
-    offer_delta = OFFER_DEADLINE - now
-    h1b_delta = H1B_REG_DEADLINE - now
-    offer_days = math.ceil(offer_delta.total_seconds() / 86400)
-    h1b_days = math.ceil(h1b_delta.total_seconds() / 86400)
+def deadline_days(now: datetime) -> tuple:
+    """Days (rounded up) until the offer and H-1B registration deadlines."""
+    offer_days = math.ceil((OFFER_DEADLINE - now).total_seconds() / 86400)
+    h1b_days = math.ceil((H1B_REG_DEADLINE - now).total_seconds() / 86400)
+    return offer_days, h1b_days
+
+
+def lists_version() -> str:
+    """Tag of the job lists' source files; changes whenever the lists may have."""
+    sigs = [_file_signature(p) for p in LIST_SOURCES]
+    return hashlib.blake2b(repr(sigs).encode(), digest_size=8).hexdigest()
+
+
+def api_data_etag(applied_limit: int = None) -> str:
+    """Weak ETag for /api/data, derived from everything the payload depends on.
+
+    Besides the source files, the countdowns and the time-windowed agent
+    "running" status change with the clock, so they are part of the tag.
+    """
+    state = (
+        [_file_signature(p) for p in DATA_SOURCES],
+        deadline_days(datetime.now()),
+        [a["status"] for a in get_agent_status()],
+        applied_limit,
+    )
+    return 'W/"%s"' % hashlib.blake2b(repr(state).encode(), digest_size=8).hexdigest()
+
+
+# Last serialized /api/data body and its compressed copies (filled in per
+# content-coding on first use), reused while its ETag holds (bounded by a TTL
+# so the payload timestamp doesn't go stale indefinitely).
+API_CACHE_TTL = 60.0
+_API_CACHE = {"etag": None, "built": 0.0, "body": b"", "encoded": {}}
+_API_CACHE_LOCK = threading.Lock()
+# Held while building a body, so concurrent misses wait for one build
+# instead of each re-parsing and re-encoding the same payload.
+_API_BUILD_LOCK = threading.Lock()
+
+
+def _api_cache_hit(etag: str):
+    with _API_CACHE_LOCK:
+        if _API_CACHE["etag"] == etag and time.monotonic() - _API_CACHE["built"] < API_CACHE_TTL:
+            return _API_CACHE["body"], _API_CACHE["encoded"]
+    return None
+
 
+def api_data_body(etag: str, applied_limit: int = None) -> tuple:
+    """(body, compressed copies by coding) of /api/data for etag, rebuilt only when it changes."""
+    hit = _api_cache_hit(etag)
+    if hit is not None:
+        return hit
+    with _API_BUILD_LOCK:
+        hit = _api_cache_hit(etag)  # built by whoever held the lock before us
+        if hit is not None:
+            return hit
+        now = time.monotonic()
+        body, encoded = encode_api_response(applied_limit), {}
+        with _API_CACHE_LOCK:
+            _API_CACHE.update(etag=etag, built=now, body=body, encoded=encoded)
+    return body, encoded
+
+
+# When each /api/data variant (per applied_limit) last changed ETag; served as
+# Last-Modified for clients that revalidate with If-Modified-Since.
+_API_VERSIONS: dict = {}
+
+
+def api_data_last_modified(etag: str, applied_limit: int = None) -> float:
+    """Wall-clock time the current etag for this applied_limit was first seen."""
+    with _API_CACHE_LOCK:
+        seen = _API_VERSIONS.get(applied_limit)
+        if seen and seen[0] == etag:
+            return seen[1]
+        # HTTP dates have 1s resolution; keep successive versions in distinct seconds.
+        modified = time.time() if seen is None else max(time.time(), seen[1] + 1)
+        if len(_API_VERSIONS) >= 32:
+            _API_VERSIONS.clear()
+        _API_VERSIONS[applied_limit] = (etag, modified)
+        return modified
+
+
+# /api/stream (server-sent events) re-checks the /api/data ETag this often and
+# pushes the payload when it changes. Each stream holds a thread for its whole
+# life, so streams get their own cap rather than a request slot.
+STREAM_POLL_SECONDS = 2.0
+STREAM_KEEPALIVE_SECONDS = 20.0
+MAX_STREAMS = 4
+_STREAM_SLOTS = threading.BoundedSemaphore(MAX_STREAMS)
+
+
+def pending_columns() -> dict:
     # Sort queues by score descending so highest-priority jobs appear first
-    queue_sections["pending"].sort(key=lambda j: j.get("score", 0), reverse=True)
-    queue_sections["manual_apply"].sort(key=lambda j: j.get("score", 0), reverse=True)
+    pending = sorted(_cached_parse(QUEUE_FILE, parse_queue)["pending"],
+                     key=lambda j: j.get("score", 0), reverse=True)
+    return to_columns(pending, QUEUE_COLUMNS)
+
+
+def manual_apply_columns() -> dict:
+    # Merge manual-apply-priority.md entries (new list: parsed results are cached)
+    manual_apply = _cached_parse(QUEUE_FILE, parse_queue)["manual_apply"] + parse_manual_apply()
+    manual_apply.sort(key=lambda j: j.get("score", 0), reverse=True)
+    return to_columns(manual_apply, QUEUE_COLUMNS)
+
+
+def applied_columns(applied_limit: int = None) -> dict:
+    applied_jobs = get_applied_jobs()
+    return to_columns(applied_jobs if applied_limit is None else applied_jobs[:applied_limit],
+                      APPLIED_COLUMNS)
+
+
+# The large /api/data sections: the files each one is derived from, and its builder.
+API_SECTIONS = {
+    "pending": ((QUEUE_FILE,), pending_columns),
+    "manual_apply": ((QUEUE_FILE, MANUAL_APPLY_FILE), manual_apply_columns),
+    "applied": ((TRACKER_FILE, DEDUP_FILE), applied_columns),
+}
+
+# Serialized API_SECTIONS, reused while their source files are unchanged.
+_SECTION_CACHE: dict = {}
+
+
+class _RawJSON(bytes):
+    """Already-serialized JSON, spliced verbatim by encode_api_response()."""
+
+
+def _build_section(name: str, *args):
+    return API_SECTIONS[name][1](*args)
+
+
+def _section_json(name: str, *args) -> _RawJSON:
+    """Serialized section `name`, rebuilt only when one of its files changed."""
+    sources, build = API_SECTIONS[name]
+    sig = (tuple(_file_signature(p) for p in sources), args)
+    hit = _SECTION_CACHE.get(name)
+    if hit is not None and hit[0] == sig:
+        return hit[1]
+    blob = _RawJSON(dumps_bytes(build(*args)))
+    _SECTION_CACHE[name] = (sig, blob)
+    return blob
+
+
+def build_api_response(applied_limit: int = None, section=None) -> dict:
+    """Build full dashboard data. applied_limit truncates the applied list.
+
+    section(name, *args) supplies the API_SECTIONS entries (built directly by default).
+    """
+    section = section or _build_section
+    now = datetime.now()
+    offer_days, h1b_days = deadline_days(now)
 
     return {
         "timestamp": now.isoformat(),
         "offer_days": offer_days,
         "h1b_days": h1b_days,
-        "agents": agents,
-        "pending": queue_sections["pending"],
-        "manual_apply": queue_sections["manual_apply"],
-        "applied": applied_jobs,
-        "applied_count": dedup_applied,
-        "pipeline": tracker_data["pipeline"],
+        "agents": get_agent_status(),
+        "pending": section("pending"),
+        "manual_apply": section("manual_apply"),
+        "applied": section("applied", applied_limit),
+        "applied_total": len(get_applied_jobs()),
+        "applied_count": count_dedup_applied(),
+        "pipeline": _cached_parse(TRACKER_FILE, parse_tracker)["pipeline"],
         "skip_list": get_skip_list(),
+        "lists": lists_version(),
+    }
+
+
+def encode_api_response(applied_limit: int = None) -> bytes:
+    """Serialize build_api_response(), splicing in cached bytes for the big sections."""
+    data = build_api_response(applied_limit, section=_section_json)
+    return b"{%s}" % b",".join(
+        dumps_bytes(key) + b":" + (value if isinstance(value, _RawJSON) else dumps_bytes(value))
+        for key, value in data.items()
+    )
+
+
+def build_summary_response() -> dict:
+    """The clock-dependent header of /api/data, with counts in place of the lists.
+
+    "lists" matches the tag in /api/data: clients refetch the lists only when
+    it changes.
+    """
+    now = datetime.now()
+    offer_days, h1b_days = deadline_days(now)
+    queue = _cached_parse(QUEUE_FILE, parse_queue)
+
+    return {
+        "timestamp": now.isoformat(),
+        "offer_days": offer_days,
+        "h1b_days": h1b_days,
+        "agents": get_agent_status(),
+        "applied_total": len(get_applied_jobs()),
+        "applied_count": count_dedup_applied(),
+        "pipeline": _cached_parse(TRACKER_FILE, parse_tracker)["pipeline"],
+        "pending_count": len(queue["pending"]),
+        "manual_count": len(queue["manual_apply"]) + len(parse_manual_apply()),
+        "skip_count": len(get_skip_list()),
+        "lists": lists_version(),
     }
 
 
@@ -882,22 +1294,133 @@ DASHBOARD_HTML = r"""<!DOCTYPE html>
 
 <div class="toast" id="toast"></div>
 
+<template id="tpl-pending-row"><tr><td class="score"></td><td></td><td></td><td></td><td></td><td class="url-cell"><a target="_blank">Open</a></td><td style="white-space:nowrap"><button class="btn-mark" data-act="mark">Mark Applied</button><button class="btn-delete" data-act="delete">Delete</button></td></tr></template>
+<template id="tpl-manual-row"><tr><td class="score"></td><td></td><td></td><td></td><td class="url-cell"><a target="_blank">Open</a></td><td style="white-space:nowrap"><button class="btn-mark" data-act="mark">Mark Applied</button><button class="btn-delete" data-act="delete">Delete</button></td></tr></template>
+<template id="tpl-applied-row"><tr><td></td><td></td><td></td><td><span class="badge"></span></td><td class="url-cell"><a target="_blank">Open</a></td><td style="white-space:nowrap">
+  <select class="stage-sel"><option>Applied</option><option>Phone Screen</option><option>Technical Interview</option><option>Take Home</option><option>Onsite/Final</option><option>Offer</option><option>Rejected</option></select>
+  <button class="btn-update" data-act="stage">Update</button>
+</td></tr></template>
+<template id="tpl-skip-row"><tr><td><strong></strong></td><td><span class="badge"></span></td><td></td><td><button class="btn-remove" data-act="remove">Remove</button></td></tr></template>
+
 <script>
 let D = null;
-let cd = 30;
+const REFRESH_MS = 30000;
+let nextRefreshAt = Date.now() + REFRESH_MS;
+let timerShown = null;
+const timerEl = document.getElementById('timer');
 let activeTab = 'pending';
 let searchQ = '';
 let stageFilter = 'all';
 let pendingSort = 'score';
 let pendingTitleFilter = 'all';
+const SAFE_URL = /^https?:/i;
+const STAGES = ['Applied','Phone Screen','Technical Interview','Take Home','Onsite/Final','Offer','Rejected'];
+const INTERVIEW_STAGES = new Set(['Phone Screen','Technical Interview','Take Home','Onsite/Final']);
+const pendingRowTpl = document.getElementById('tpl-pending-row').content.firstElementChild;
+const manualRowTpl = document.getElementById('tpl-manual-row').content.firstElementChild;
+const appliedRowTpl = document.getElementById('tpl-applied-row').content.firstElementChild;
+const skipRowTpl = document.getElementById('tpl-skip-row').content.firstElementChild;
+let pendingRows = new Map();
+let manualRows = new Map();
+let appliedRows = new Map();
+let skipRows = new Map();
+
+let inflight = null;
+let stream = null;
+let live = false;
 
 async function refresh() {
+  // A newer refresh supersedes one still waiting on the network.
+  if (inflight) inflight.abort();
+  const ctl = inflight = new AbortController();
   try {
-    const r = await fetch('/api/data');
-    D = await r.json();
-    render();
-    cd = 30;
-  } catch(e) { toast('Failed to refresh: ' + e.message, 1); }
+    const r = await fetch('/api/data', {signal: ctl.signal});
+    applyData(await r.json());
+  } catch(e) {
+    if (e.name !== 'AbortError') toast('Failed to refresh: ' + e.message, 1);
+  } finally {
+    if (inflight === ctl) inflight = null;
+  }
+}
+
+// Polls without the stream: fetch the small summary, and the full payload
+// only when the summary says the job lists changed.
+async function refreshSummary() {
+  if (inflight) return;
+  try {
+    const r = await fetch('/api/summary');
+    applySummary(await r.json());
+  } catch(e) {
+    toast('Failed to refresh: ' + e.message, 1);
+  }
+}
+
+function applySummary(s) {
+  if (!D || s.lists !== D.lists) { refresh(); return; }
+  Object.assign(D, s);
+  scheduleRender();
+  nextRefreshAt = Date.now() + REFRESH_MS;
+}
+
+// Payload section -> panel that renders it. A panel is marked dirty only
+// when its section's JSON differs from the last payload's.
+const SECTION_PANELS = {pending: 'pending', manual_apply: 'manual', applied: 'applied', skip_list: 'skip'};
+const sectionSigs = {};
+
+function applyData(data) {
+  for (const [key, panel] of Object.entries(SECTION_PANELS)) {
+    const sig = JSON.stringify(data[key]);
+    if (sig !== sectionSigs[key]) {
+      sectionSigs[key] = sig;
+      dirtyPanels.add(panel);
+    }
+  }
+  D = data;
+  D.pending = rows(D.pending);
+  D.manual_apply = rows(D.manual_apply);
+  D.applied = rows(D.applied);
+  // Lowercased once per payload rather than per row on every search keystroke.
+  for (const j of D.applied) j.search = (j.company + '\n' + j.title).toLowerCase();
+  scheduleRender();
+  nextRefreshAt = Date.now() + REFRESH_MS;
+}
+
+// Updates arriving in the same frame (a stream message racing the refresh
+// after a click) are painted once.
+let renderQueued = false;
+function scheduleRender() {
+  if (renderQueued) return;
+  renderQueued = true;
+  requestAnimationFrame(() => { renderQueued = false; render(); });
+}
+
+// Server-sent updates replace polling while the stream is up; if it drops,
+// the EventSource reconnects on its own and tick() polls in the meantime.
+function openStream() {
+  stream = new EventSource('/api/stream');
+  stream.onopen = () => { live = true; };
+  stream.onmessage = e => applyData(JSON.parse(e.data));
+  stream.addEventListener('summary', e => applySummary(JSON.parse(e.data)));
+  stream.onerror = () => { live = false; if (!D) refresh(); };
+}
+
+function closeStream() {
+  if (stream) stream.close();
+  stream = null;
+  live = false;
+}
+
+// Job lists arrive column-major ({field: [values]}); rebuild row objects.
+function rows(cols) {
+  const keys = Object.keys(cols);
+  const n = keys.length ? cols[keys[0]].length : 0;
+  const out = new Array(n);
+  for (let i = 0; i < n; i++) {
+    const o = {};
+    for (const k of keys) o[k] = cols[k][i];
+    out[i] = o;
+  }
+  return out;
 }
 
 function render() {
@@ -924,9 +1447,7 @@ function render() {
 
   // Stats
   const p = D.pipeline;
-  const interviews = (D.applied || []).filter(j =>
-    ['Phone Screen','Technical Interview','Take Home','Onsite/Final'].includes(j.stage)
-  ).length;
+  const interviews = (D.applied || []).filter(j => INTERVIEW_STAGES.has(j.stage)).length;
   document.getElementById('stats').innerHTML = `
     <div class="stat"><div class="value v-yellow">${D.pending.length}</div><div class="label">Queue</div></div>
     <div class="stat"><div class="value v-green">${D.applied_count}</div><div class="label">Applied</div></div>
@@ -935,26 +1456,52 @@ function render() {
     <div class="stat"><div class="value v-red">${p['Rejected']||0}</div><div class="label">Rejected</div></div>`;
 
   // Agents
-  document.getElementById('agents').innerHTML = '<span class="lbl">Agents:</span>' +
-    D.agents.map(a => `<span><span class="dot ${a.status}"></span>${h(a.name)}${a.errors>0?' <span style="color:#f85149">('+a.errors+' err)</span>':''}</span>`).join('');
+  renderAgents();
 
   // Tabs
   document.getElementById('tabs').innerHTML = `
-    <div class="tab ${activeTab==='pending'?'active':''}" onclick="tab('pending')">Pending Queue (${D.pending.length})</div>
-    <div class="tab ${activeTab==='manual'?'active':''}" onclick="tab('manual')">Manual Apply (${D.manual_apply.length})</div>
-    <div class="tab ${activeTab==='applied'?'active':''}" onclick="tab('applied')">Applied (${D.applied_count})</div>
-    <div class="tab ${activeTab==='skip'?'active':''}" onclick="tab('skip')">Skip List (${D.skip_list.length})</div>`;
-
-  renderPending();
-  renderManual();
-  renderApplied();
-  renderSkip();
+    <div class="tab ${activeTab==='pending'?'active':''}" data-tab="pending">Pending Queue (${D.pending.length})</div>
+    <div class="tab ${activeTab==='manual'?'active':''}" data-tab="manual">Manual Apply (${D.manual_apply.length})</div>
+    <div class="tab ${activeTab==='applied'?'active':''}" data-tab="applied">Applied (${D.applied_count})</div>
+    <div class="tab ${activeTab==='skip'?'active':''}" data-tab="skip">Skip List (${D.skip_list.length})</div>`;
+
+  // Only the visible panel is rebuilt now; the others when they're opened.
+  renderActive();
+}
+
+const PANEL_RENDERERS = {pending: renderPending, manual: renderManual, applied: renderApplied, skip: renderSkip};
+let dirtyPanels = new Set();
+
+function renderActive() {
+  if (D && dirtyPanels.delete(activeTab)) PANEL_RENDERERS[activeTab]();
+}
+
+function renderAgents() {
+  const frag = document.createDocumentFragment();
+  const lbl = document.createElement('span');
+  lbl.className = 'lbl';
+  lbl.textContent = 'Agents:';
+  frag.appendChild(lbl);
+  for (const a of D.agents) {
+    const item = document.createElement('span');
+    const dot = document.createElement('span');
+    dot.className = 'dot ' + a.status;
+    item.append(dot, a.name);
+    if (a.errors > 0) {
+      const err = document.createElement('span');
+      err.style.color = '#f85149';
+      err.textContent = '(' + a.errors + ' err)';
+      item.append(' ', err);
+    }
+    frag.appendChild(item);
+  }
+  document.getElementById('agents').replaceChildren(frag);
 }
 
 function renderPending() {
   const el = document.getElementById('p-pending');
   let jobs = [...(D.pending || [])];
-  const allTitles = [...new Set(jobs.map(j => j.title).filter(Boolean))].sort();
+  const allTitles = pendingTitles(D.pending || []);
   if (pendingTitleFilter !== 'all') {
     jobs = jobs.filter(j => j.title === pendingTitleFilter);
   }
@@ -966,35 +1513,125 @@ function renderPending() {
     jobs.sort((a, b) => (b.score || 0) - (a.score || 0));
   }
   const filteredNote = pendingTitleFilter !== 'all' ? ` of ${D.pending.length}` : '';
-  el.innerHTML = `
+  const shell = tableShell(el, ['Score','Company','Title','Location','H-1B','Link','']);
+  // The filter bar is built once; later renders only sync its values.
+  if (!shell.bar.firstChild) {
+    shell.bar.innerHTML = `
     <div class="filter-bar" style="display:flex;gap:8px;align-items:center;padding:8px 0;flex-wrap:wrap">
-      <select onchange="pendingSort=this.value;renderPending()" style="padding:4px 8px;border-radius:4px;border:1px solid #444;background:#222;color:#e0e0e0">
-        <option value="score" ${pendingSort==='score'?'selected':''}>Sort: Score ↓</option>
-        <option value="company" ${pendingSort==='company'?'selected':''}>Sort: Company A→Z</option>
-        <option value="location" ${pendingSort==='location'?'selected':''}>Sort: Location A→Z</option>
+      <select class="sort" onchange="pendingSort=this.value;renderPending()" style="padding:4px 8px;border-radius:4px;border:1px solid #444;background:#222;color:#e0e0e0">
+        <option value="score">Sort: Score ↓</option>
+        <option value="company">Sort: Company A→Z</option>
+        <option value="location">Sort: Location A→Z</option>
       </select>
-      <select onchange="pendingTitleFilter=this.value;renderPending()" style="padding:4px 8px;border-radius:4px;border:1px solid #444;background:#222;color:#e0e0e0;max-width:300px">
-        <option value="all" ${pendingTitleFilter==='all'?'selected':''}>All Titles</option>
-        ${allTitles.map(t => `<option value="${h(t)}" ${pendingTitleFilter===t?'selected':''}>${h(t)}</option>`).join('')}
+      <select class="title-filter" onchange="pendingTitleFilter=this.value;renderPending()" style="padding:4px 8px;border-radius:4px;border:1px solid #444;background:#222;color:#e0e0e0;max-width:300px">
+        <option value="all">All Titles</option>
       </select>
-      <span style="color:#888;font-size:13px">${jobs.length}${filteredNote} jobs</span>
-    </div>
-    ${jobs.length === 0 ? '<div class="empty">No matching jobs</div>' : `<table>
-    <tr><th>Score</th><th>Company</th><th>Title</th><th>Location</th><th>H-1B</th><th>Link</th><th></th></tr>
-    ${jobs.map(j => `<tr>
-      <td class="score">${j.score}</td>
-      <td>${h(j.company)}</td>
-      <td>${h(j.title)}</td>
-      <td>${h(j.location)}</td>
-      <td>${h(j.h1b||'').substring(0,20)}</td>
-      <td class="url-cell"><a href="${h(j.url)}" target="_blank">Open</a></td>
-      <td style="white-space:nowrap"><button class="btn-mark" data-url="${h(j.url)}" data-company="${h(j.company)}" data-title="${h(j.title)}" onclick="markBtnPending(this)">Mark Applied</button><button class="btn-delete" data-url="${h(j.url)}" data-company="${h(j.company)}" data-title="${h(j.title)}" onclick="deleteBtnPending(this)">Delete</button></td>
-    </tr>`).join('')}
-    </table>`}`;
+      <span class="count" style="color:#888;font-size:13px"></span>
+    </div>`;
+  }
+  shell.bar.querySelector('.sort').value = pendingSort;
+  const titleSel = shell.bar.querySelector('.title-filter');
+  if (titleSel.titles !== allTitles) {
+    titleSel.titles = allTitles;
+    const opts = [titleSel.firstElementChild];
+    for (const t of allTitles) {
+      const opt = document.createElement('option');
+      opt.value = opt.textContent = t;
+      opts.push(opt);
+    }
+    titleSel.replaceChildren(...opts);
+  }
+  titleSel.value = pendingTitleFilter;
+  setText(shell.bar.querySelector('.count'), `${jobs.length}${filteredNote} jobs`);
+  shell.empty.hidden = jobs.length > 0;
+  shell.table.hidden = jobs.length === 0;
+  pendingRows = patchRows(shell.tbody, jobs, pendingRows, pendingRowTpl, fillPendingRow);
+}
+
+// Sorted distinct titles for the pending filter, recomputed only when a new
+// payload replaces D.pending (not on every sort or filter change).
+let titlesFor = null, titlesCache = [];
+function pendingTitles(jobs) {
+  if (jobs !== titlesFor) {
+    titlesFor = jobs;
+    titlesCache = [...new Set(jobs.map(j => j.title).filter(Boolean))].sort();
+  }
+  return titlesCache;
 }
 
-async function markBtnPending(btn) {
-  const url = btn.dataset.url, company = btn.dataset.company, title = btn.dataset.title;
+function fillPendingRow(tr, j) {
+  const c = tr.cells;
+  setText(c[0], String(j.score ?? ''));
+  setText(c[1], j.company || '');
+  setText(c[2], j.title || '');
+  setText(c[3], j.location || '');
+  setText(c[4], (j.h1b || '').substring(0, 20));
+  setHref(c[5].firstElementChild, j.url);
+}
+
+// Panels with a job table are built once (filter slot, empty note, table);
+// later renders only patch their <tbody>.
+function tableShell(el, heads, emptyText = 'No matching jobs') {
+  if (!el.shell) {
+    el.innerHTML = `<div></div><div class="empty">${emptyText}</div>
+      <table><thead><tr>${heads.map(t => `<th>${t}</th>`).join('')}</tr></thead><tbody></tbody></table>`;
+    el.shell = {bar: el.children[0], empty: el.children[1], table: el.children[2], tbody: el.querySelector('tbody')};
+  }
+  return el.shell;
+}
+
+// Keyed reconciliation: each job keeps its <tr> across renders (keyed by URL),
+// rows are moved only when the order changes and fill() only writes cells
+// whose value differs. Returns the key -> row map for the next render.
+function patchRows(tbody, jobs, prevRows, tpl, fill, keyOf = jobKey) {
+  const rowsByKey = new Map();
+  const frag = tbody.firstChild ? null : document.createDocumentFragment();
+  let cursor = tbody.firstElementChild;
+  for (const j of jobs) {
+    let key = keyOf(j);
+    while (rowsByKey.has(key)) key += '\u0000';
+    const tr = prevRows.get(key) || tpl.cloneNode(true);
+    fill(tr, j, tr.job);
+    tr.job = j;
+    rowsByKey.set(key, tr);
+    if (frag) frag.appendChild(tr);
+    else if (tr === cursor) cursor = cursor.nextElementSibling;
+    else tbody.insertBefore(tr, cursor);
+  }
+  if (frag) tbody.appendChild(frag);
+  while (cursor) {
+    const next = cursor.nextElementSibling;
+    cursor.remove();
+    cursor = next;
+  }
+  return rowsByKey;
+}
+
+function jobKey(j) {
+  return j.url || j.company + '\u0000' + j.title;
+}
+
+function setText(node, text) {
+  if (node.textContent !== text) node.textContent = text;
+}
+
+function setHref(a, url) {
+  if (!SAFE_URL.test(url)) a.removeAttribute('href');
+  else if (a.getAttribute('href') !== url) a.setAttribute('href', url);
+}
+
+// Row buttons are handled by one delegated listener per panel; each <tr>
+// carries the job it was rendered from. Pending and Manual Apply rows share it.
+function onQueueClick(e) {
+  const btn = e.target.closest('button[data-act]');
+  if (!btn) return;
+  const job = btn.closest('tr').job;
+  if (btn.dataset.act === 'mark') markJob(btn, job);
+  else if (btn.dataset.act === 'delete') deleteJob(btn, job);
+}
+
+async function markJob(btn, job) {
+  const {url, company, title} = job;
   if (!confirm(`Mark "${company} — ${title}" as applied?`)) return;
   btn.disabled = true; btn.textContent = '...';
   try {
@@ -1008,8 +1645,8 @@ async function markBtnPending(btn) {
   } catch(e) { toast('Error: ' + e.message, 1); btn.disabled = false; btn.textContent = 'Mark Applied'; }
 }
 
-async function deleteBtnPending(btn) {
-  const url = btn.dataset.url, company = btn.dataset.company, title = btn.dataset.title;
+async function deleteJob(btn, job) {
+  const {url, company, title} = job;
   if (!confirm(`DELETE "${company} — ${title}"?\\n\\nThis removes it from the queue and permanently blocks re-adding.`)) return;
   btn.disabled = true; btn.textContent = '...';
   try {
@@ -1026,85 +1663,80 @@ async function deleteBtnPending(btn) {
 function renderManual() {
   const el = document.getElementById('p-manual');
   const jobs = D.manual_apply;
-  if (!jobs.length) { el.innerHTML = '<div class="empty">No manual apply jobs</div>'; return; }
-  el.innerHTML = `<table>
-    <tr><th>Score</th><th>Company</th><th>Title</th><th>Location</th><th>Link</th><th></th></tr>
-    ${jobs.map((j,i) => `<tr>
-      <td class="score">${j.score||'-'}</td>
-      <td>${h(j.company)}</td>
-      <td>${h(j.title)}</td>
-      <td>${h(j.location)}</td>
-      <td class="url-cell"><a href="${h(j.url)}" target="_blank">Open</a></td>
-      <td style="white-space:nowrap"><button class="btn-mark" data-i="${i}" data-t="manual" onclick="markBtn(this)">Mark Applied</button><button class="btn-delete" data-i="${i}" data-t="manual" onclick="deleteBtn(this)">Delete</button></td>
-    </tr>`).join('')}
-  </table>`;
+  const shell = tableShell(el, ['Score','Company','Title','Location','Link',''], 'No manual apply jobs');
+  shell.empty.hidden = jobs.length > 0;
+  shell.table.hidden = jobs.length === 0;
+  manualRows = patchRows(shell.tbody, jobs, manualRows, manualRowTpl, fillManualRow);
+}
+
+function fillManualRow(tr, j) {
+  const c = tr.cells;
+  setText(c[0], String(j.score || '-'));
+  setText(c[1], j.company || '');
+  setText(c[2], j.title || '');
+  setText(c[3], j.location || '');
+  setHref(c[4].firstElementChild, j.url);
 }
 
 function renderApplied() {
   const el = document.getElementById('p-applied');
   let jobs = D.applied;
-  const activeEl = document.activeElement;
-  const restoreSearchFocus = activeEl && activeEl.id === 'applied-search';
-  const caretStart = restoreSearchFocus ? activeEl.selectionStart : null;
-  const caretEnd = restoreSearchFocus ? activeEl.selectionEnd : null;
-
-  if (searchQ) {
-    const s = searchQ.toLowerCase();
-    jobs = jobs.filter(j => j.company.toLowerCase().includes(s) || j.title.toLowerCase().includes(s));
-  }
-  if (stageFilter !== 'all') {
-    jobs = jobs.filter(j => j.stage === stageFilter);
+  const q = searchQ.toLowerCase();
+  if (q || stageFilter !== 'all') {
+    jobs = jobs.filter(j => (stageFilter === 'all' || j.stage === stageFilter) && (!q || j.search.includes(q)));
   }
 
-  el.innerHTML = `
+  const shell = tableShell(el, ['Company','Title','Date','Stage','Link','Update Stage']);
+  // Built once, so the search box keeps its focus and caret while typing.
+  if (!shell.bar.firstChild) {
+    shell.bar.innerHTML = `
     <div class="filter-bar">
-      <input type="text" id="applied-search" placeholder="Search company or title..." value="${h(searchQ)}" oninput="searchQ=this.value;renderApplied()" />
-      <select onchange="stageFilter=this.value;renderApplied()">
-        <option value="all" ${stageFilter==='all'?'selected':''}>All Stages</option>
-        <option value="Applied" ${stageFilter==='Applied'?'selected':''}>Applied</option>
-        <option value="Phone Screen" ${stageFilter==='Phone Screen'?'selected':''}>Phone Screen</option>
-        <option value="Technical Interview" ${stageFilter==='Technical Interview'?'selected':''}>Technical Interview</option>
-        <option value="Take Home" ${stageFilter==='Take Home'?'selected':''}>Take Home</option>
-        <option value="Onsite/Final" ${stageFilter==='Onsite/Final'?'selected':''}>Onsite/Final</option>
-        <option value="Offer" ${stageFilter==='Offer'?'selected':''}>Offer</option>
-        <option value="Rejected" ${stageFilter==='Rejected'?'selected':''}>Rejected</option>
+      <input type="text" id="applied-search" placeholder="Search company or title..." oninput="onAppliedSearch(this.value)" />
+      <select class="stage-filter" onchange="stageFilter=this.value;renderApplied()">
+        <option value="all">All Stages</option>
+        ${STAGES.map(s => `<option value="${s}">${s}</option>`).join('')}
       </select>
-      <span class="count">${jobs.length} jobs</span>
-    </div>
-    ${jobs.length === 0 ? '<div class="empty">No matching jobs</div>' : `<table>
-    <tr><th>Company</th><th>Title</th><th>Date</th><th>Stage</th><th>Link</th><th>Update Stage</th></tr>
-    ${jobs.map((j,i) => `<tr>
-      <td>${h(j.company)}</td>
-      <td>${h(j.title)}</td>
-      <td>${h(j.date)}</td>
-      <td><span class="badge ${bc(j.stage)}">${h(j.stage)}</span></td>
-      <td class="url-cell"><a href="${h(j.url)}" target="_blank">Open</a></td>
-      <td style="white-space:nowrap">
-        <select class="stage-sel" id="ss-${i}">
-          ${['Applied','Phone Screen','Technical Interview','Take Home','Onsite/Final','Offer','Rejected'].map(s =>
-            '<option value="'+s+'" '+(j.stage===s?'selected':'')+'>'+s+'</option>'
-          ).join('')}
-        </select>
-        <button class="btn-update" data-i="${i}" onclick="updateBtn(this)">Update</button>
-      </td>
-    </tr>`).join('')}
-    </table>`}`;
-  if (restoreSearchFocus) {
-    const input = document.getElementById('applied-search');
-    if (input) {
-      input.focus();
-      if (caretStart !== null && caretEnd !== null) {
-        input.setSelectionRange(caretStart, caretEnd);
-      }
-    }
+      <span class="count"></span>
+    </div>`;
   }
+  const input = shell.bar.querySelector('#applied-search');
+  if (input.value !== searchQ) input.value = searchQ;
+  shell.bar.querySelector('.stage-filter').value = stageFilter;
+  setText(shell.bar.querySelector('.count'), `${jobs.length} jobs`);
+  shell.empty.hidden = jobs.length > 0;
+  shell.table.hidden = jobs.length === 0;
+  appliedRows = patchRows(shell.tbody, jobs, appliedRows, appliedRowTpl, fillAppliedRow);
+}
+
+// Fast typing is filtered once it pauses rather than on every keystroke.
+const SEARCH_DEBOUNCE_MS = 150;
+let searchTimer = 0;
+function onAppliedSearch(value) {
+  searchQ = value;
+  clearTimeout(searchTimer);
+  searchTimer = setTimeout(renderApplied, SEARCH_DEBOUNCE_MS);
 }
 
+function fillAppliedRow(tr, j, prev) {
+  const c = tr.cells;
+  setText(c[0], j.company || '');
+  setText(c[1], j.title || '');
+  setText(c[2], j.date || '');
+  setHref(c[4].firstElementChild, j.url);
+  // Leave a stage the user picked but hasn't applied yet unless the job moved.
+  if (prev && prev.stage === j.stage) return;
+  const badge = c[3].firstElementChild;
+  badge.className = 'badge ' + bc(j.stage);
+  badge.textContent = j.stage || '';
+  c[5].querySelector('select').selectedIndex = Math.max(STAGES.indexOf(j.stage), 0);
+}
+
+const STAGE_BADGES = {'Applied':'b-applied','Phone Screen':'b-phone','Technical Interview':'b-interview',
+  'Take Home':'b-takehome','Onsite/Final':'b-interview',
+  'Offer':'b-offer','Rejected':'b-rejected'};
+
 function bc(stage) {
-  const m = {'Applied':'b-applied','Phone Screen':'b-phone','Technical Interview':'b-interview',
-    'Take Home':'b-takehome','Onsite/Final':'b-interview',
-    'Offer':'b-offer','Rejected':'b-rejected'};
-  return m[stage] || 'b-applied';
+  return STAGE_BADGES[stage] || 'b-applied';
 }
 
 function tab(name) {
@@ -1114,57 +1746,18 @@ function tab(name) {
   const idx = {pending:0, manual:1, applied:2, skip:3}[name];
   document.querySelectorAll('.tab')[idx].classList.add('active');
   document.getElementById('p-' + name).classList.add('active');
+  renderActive();
 }
 
-async function markBtn(btn) {
-  const type = btn.dataset.t;
-  const idx = parseInt(btn.dataset.i);
-  const job = type === 'pending' ? D.pending[idx] : D.manual_apply[idx];
-  if (!job) return;
-  if (!confirm('Mark "' + job.company + ' \u2014 ' + job.title + '" as applied?')) return;
-  try {
-    const r = await fetch('/api/mark-applied', {
-      method: 'POST', headers: {'Content-Type': 'application/json'},
-      body: JSON.stringify({url: job.url, company: job.company, title: job.title})
-    });
-    const res = await r.json();
-    if (res.ok) { toast(res.message); refresh(); }
-    else { toast(res.error || 'Failed', 1); }
-  } catch(e) { toast('Error: ' + e.message, 1); }
-}
 
-async function deleteBtn(btn) {
-  const type = btn.dataset.t;
-  const idx = parseInt(btn.dataset.i);
-  const job = type === 'pending' ? D.pending[idx] : D.manual_apply[idx];
-  if (!job) return;
-  if (!confirm('DELETE "' + job.company + ' \u2014 ' + job.title + '"?\n\nThis removes it from the queue and permanently blocks it from being re-added.')) return;
-  try {
-    const r = await fetch('/api/delete-job', {
-      method: 'POST', headers: {'Content-Type': 'application/json'},
-      body: JSON.stringify({url: job.url, company: job.company, title: job.title})
-    });
-    const res = await r.json();
-    if (res.ok) { toast(res.message); refresh(); }
-    else { toast(res.error || 'Failed', 1); }
-  } catch(e) { toast('Error: ' + e.message, 1); }
+function onAppliedClick(e) {
+  const btn = e.target.closest('button[data-act="stage"]');
+  if (!btn) return;
+  const row = btn.closest('tr');
+  updateBtn(row.job, row.querySelector('.stage-sel'));
 }
 
-async function updateBtn(btn) {
-  const idx = parseInt(btn.dataset.i);
-  const sel = document.getElementById('ss-' + idx);
-  if (!sel) return;
-  // Get the filtered list to find the right job
-  let jobs = D.applied;
-  if (searchQ) {
-    const s = searchQ.toLowerCase();
-    jobs = jobs.filter(j => j.company.toLowerCase().includes(s) || j.title.toLowerCase().includes(s));
-  }
-  if (stageFilter !== 'all') {
-    jobs = jobs.filter(j => j.stage === stageFilter);
-  }
-  const job = jobs[idx];
-  if (!job) return;
+async function updateBtn(job, sel) {
   // Use URL as search term for precision (unique per job)
   const searchKey = job.url || job.company;
   try {
@@ -1199,8 +1792,10 @@ async function addJob(dest) {
 function renderSkip() {
   const el = document.getElementById('p-skip');
   const list = D.skip_list || [];
-  const catBadge = c => ({csp:'b-csp',limit:'b-limit',technical:'b-technical',captcha:'b-captcha'}[c]||'b-manual');
-  el.innerHTML = `
+  const shell = tableShell(el, ['Company','Category','Reason',''], 'No companies in skip list');
+  // The add form is built once, so a refresh doesn't wipe what's being typed.
+  if (!shell.bar.firstChild) {
+    shell.bar.innerHTML = `
     <div class="skip-add-bar">
       <input type="text" id="skip-name" placeholder="Company name..." />
       <input type="text" id="skip-reason" placeholder="Reason (e.g. CSP blocks automation)" style="flex:2" />
@@ -1211,17 +1806,31 @@ function renderSkip() {
         <option value="captcha">CAPTCHA</option>
         <option value="manual">Other</option>
       </select>
-      <button class="btn-add-skip" onclick="addSkip()">Add to Skip List</button>
-    </div>
-    ${list.length === 0 ? '<div class="empty">No companies in skip list</div>' : `<table>
-    <tr><th>Company</th><th>Category</th><th>Reason</th><th></th></tr>
-    ${list.map(c => `<tr>
-      <td><strong>${h(c.name)}</strong></td>
-      <td><span class="badge ${catBadge(c.category)}">${h(c.category||'manual')}</span></td>
-      <td>${h(c.reason)}</td>
-      <td><button class="btn-remove" onclick="removeSkip('${h(c.name).replace(/'/g,"\\'")}')">Remove</button></td>
-    </tr>`).join('')}
-    </table>`}`;
+      <button class="btn-add-skip" data-act="add">Add to Skip List</button>
+    </div>`;
+  }
+  shell.empty.hidden = list.length > 0;
+  shell.table.hidden = list.length === 0;
+  skipRows = patchRows(shell.tbody, list, skipRows, skipRowTpl, fillSkipRow, c => c.name);
+}
+
+const SKIP_BADGES = {csp:'b-csp', limit:'b-limit', technical:'b-technical', captcha:'b-captcha'};
+
+function fillSkipRow(tr, c) {
+  const cells = tr.cells;
+  setText(cells[0].firstElementChild, c.name || '');
+  const badge = cells[1].firstElementChild;
+  const cls = 'badge ' + (SKIP_BADGES[c.category] || 'b-manual');
+  if (badge.className !== cls) badge.className = cls;
+  setText(badge, c.category || 'manual');
+  setText(cells[2], c.reason || '');
+}
+
+function onSkipClick(e) {
+  const btn = e.target.closest('button[data-act]');
+  if (!btn) return;
+  if (btn.dataset.act === 'add') addSkip();
+  else if (btn.dataset.act === 'remove') removeSkip(btn.closest('tr').job.name);
 }
 
 async function addSkip() {
@@ -1261,94 +1870,287 @@ function toast(msg, err) {
   setTimeout(() => t.style.display = 'none', 3000);
 }
 
-function h(s) { return (s||'').replace(/&/g,'&amp;').replace(/</g,'&lt;').replace(/>/g,'&gt;').replace(/"/g,'&quot;').replace(/'/g,'&#39;'); }
+// Countdown to the next poll: only touch the DOM when the shown second changes.
+// Hidden tabs don't poll; they catch up once when shown again.
+function tick() {
+  if (document.hidden) return;
+  if (live) {
+    if (timerShown !== 'live') { timerShown = 'live'; timerEl.textContent = 'Live updates'; }
+    return;
+  }
+  const left = Math.ceil((nextRefreshAt - Date.now()) / 1000);
+  if (left <= 0) { nextRefreshAt = Date.now() + REFRESH_MS; refreshSummary(); return; }
+  if (left === timerShown) return;
+  timerShown = left;
+  timerEl.textContent = 'Refreshing in ' + left + 's';
+}
 
-refresh();
-setInterval(() => {
-  cd--;
-  document.getElementById('timer').textContent = 'Refreshing in ' + cd + 's';
-  if (cd <= 0) { refresh(); cd = 30; }
-}, 1000);
+document.getElementById('p-pending').addEventListener('click', onQueueClick);
+document.getElementById('tabs').addEventListener('click', e => {
+  const t = e.target.closest('.tab[data-tab]');
+  if (t) tab(t.dataset.tab);
+});
+document.getElementById('p-manual').addEventListener('click', onQueueClick);
+document.getElementById('p-applied').addEventListener('click', onAppliedClick);
+document.getElementById('p-skip').addEventListener('click', onSkipClick);
+document.addEventListener('visibilitychange', () => {
+  if (!window.EventSource) {
+    if (!document.hidden) { nextRefreshAt = Date.now() + REFRESH_MS; refresh(); }
+  } else if (document.hidden) {
+    closeStream();
+  } else {
+    openStream();  // the first event carries the current data
+  }
+});
+if (window.EventSource) openStream(); else refresh();
+setInterval(tick, 1000);
 </script>
 </body>
 </html>
 """
 
+# Static page: encode, compress and tag once at import instead of per request.
+DASHBOARD_HTML_BYTES = DASHBOARD_HTML.encode("utf-8")
+DASHBOARD_HTML_ENCODED = {"gzip": gzip.compress(DASHBOARD_HTML_BYTES, compresslevel=9)}
+DASHBOARD_HTML_ETAG = 'W/"%s"' % hashlib.blake2b(DASHBOARD_HTML_BYTES, digest_size=8).hexdigest()
+DASHBOARD_HTML_MODIFIED = time.time()
+
 
 class DashboardHandler(http.server.BaseHTTPRequestHandler):
+    # Keep-alive: every response carries a Content-Length so the browser can
+    # reuse the connection across polls. Idle connections are dropped after
+    # `timeout` seconds (longer than the 30s poll interval).
+    protocol_version = "HTTP/1.1"
+    timeout = 65
+    # Buffer the write side so the status line, headers and body go out in a
+    # single send(); handle_one_request() flushes after every request.
+    wbufsize = 1 << 16
+    disable_nagle_algorithm = True
+
     def log_message(self, format, *args):
         pass
 
     def do_GET(self):
-        if self.path == "/" or self.path == "/index.html":
-            self.send_response(200)
-            self.send_header("Content-Type", "text/html")
-            self.end_headers()
-            self.wfile.write(DASHBOARD_HTML.encode())
-        elif self.path == "/api/data":
-            self.send_response(200)
-            self.send_header("Content-Type", "application/json")
-            self.end_headers()
-            self.wfile.write(json.dumps(build_api_response()).encode())
+        url = urlsplit(self.path)
+        route = self.GET_ROUTES.get(url.path)
+        if route is None:
+            self.send_empty(404)
         else:
-            self.send_response(404)
-            self.end_headers()
+            route(self, url)
 
+    @_bounded
     def do_POST(self):
-        if self.path == "/api/mark-applied":
+        route = self.POST_ROUTES.get(self.path)
+        if route is None:
+            # The request body was never read; don't try to parse it as the next request.
+            self.send_empty(404, {"Connection": "close"})
+            return
+        body = self.read_json()
+        if body is not None:
+            self.send_json(route(body))
+
+    @_bounded
+    def get_page(self, url):
+        validators = {"ETag": DASHBOARD_HTML_ETAG,
+                      "Last-Modified": formatdate(DASHBOARD_HTML_MODIFIED, usegmt=True)}
+        if self.not_modified(DASHBOARD_HTML_ETAG, DASHBOARD_HTML_MODIFIED):
+            self.send_empty(304, validators)
+            return
+        self.send_body(DASHBOARD_HTML_BYTES, "text/html; charset=utf-8",
+                       headers={**validators, "Cache-Control": "no-cache"},
+                       encoded=DASHBOARD_HTML_ENCODED)
+
+    @_bounded
+    def get_data(self, url):
+        query = parse_qs(url.query)
+        try:
+            applied_limit = max(0, int(query["applied_limit"][0]))
+        except (KeyError, ValueError):
+            applied_limit = None
+        etag = api_data_etag(applied_limit)
+        modified = api_data_last_modified(etag, applied_limit)
+        validators = {"ETag": etag, "Last-Modified": formatdate(modified, usegmt=True)}
+        if self.not_modified(etag, modified):
+            self.send_empty(304, validators)
+            return
+        body, encoded = api_data_body(etag, applied_limit)
+        self.send_body(body, "application/json",
+                       headers={**validators, "Cache-Control": "no-cache"}, encoded=encoded)
+
+    @_bounded
+    def get_summary(self, url):
+        # Depends on a subset of what /api/data does, so its ETag works here too.
+        etag = api_data_etag()
+        if self.not_modified(etag, api_data_last_modified(etag)):
+            self.send_empty(304, {"ETag": etag})
+            return
+        self.send_json(build_summary_response(), {"ETag": etag, "Cache-Control": "no-cache"})
+
+    def stream_data(self, url):
+        """Hold the connection open and send /api/data as an SSE event on every change.
+
+        Changes that leave the job lists alone (countdowns, agent status) are
+        sent as the much smaller /api/summary, in a "summary" event.
+        Not _bounded: a stream lives as long as the tab, so it has its own cap.
+        """
+        if not _STREAM_SLOTS.acquire(blocking=False):
+            self.send_empty(503, {"Retry-After": "30"})
+            return
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.wfile.write(b"retry: 5000\n\n")
+            sent, sent_lists, idle = None, None, 0.0
+            while True:
+                etag = api_data_etag()
+                if etag != sent:
+                    lists = lists_version()
+                    # Compact JSON has no raw newlines, so it fits one data: line.
+                    if lists == sent_lists:
+                        self.wfile.write(b"event: summary\ndata: " + dumps_bytes(build_summary_response()) + b"\n\n")
+                    else:
+                        self.wfile.write(b"data: " + api_data_body(etag)[0] + b"\n\n")
+                    sent, sent_lists, idle = etag, lists, 0.0
+                elif idle >= STREAM_KEEPALIVE_SECONDS:
+                    self.wfile.write(b": keep-alive\n\n")
+                    idle = 0.0
+                self.wfile.flush()
+                # SSE clients send nothing after the request, so the socket
+                # turning readable means it was closed: free the slot now.
+                if select.select([self.connection], [], [], STREAM_POLL_SECONDS)[0]:
+                    return
+                idle += STREAM_POLL_SECONDS
+        except OSError:
+            pass  # client went away
+        finally:
+            _STREAM_SLOTS.release()
+
+    def read_json(self):
+        """Parse the JSON object in the request body.
+
+        Returns None when the body is refused (400/413/415, already answered)
+        or the client hung up mid-body.
+        """
+        try:
             length = int(self.headers.get("Content-Length", 0))
-            body = json.loads(self.rfile.read(length)) if length else {}
-            result = mark_as_applied(body.get("url", ""), body.get("company", ""), body.get("title", ""))
-            self.send_json(result)
+        except ValueError:
+            length = -1
+        if length < 0:
+            code, error = 400, "Invalid Content-Length"
+        elif length > MAX_POST_BYTES:
+            code, error = 413, "Request body too large"
+        elif length and self.headers.get_content_type() != "application/json":
+            code, error = 415, "Expected application/json"
+        else:
+            code = None
+        if code is not None:
+            # The body is left unread, so the connection can't carry another request.
+            self.send_json({"ok": False, "error": error}, {"Connection": "close"}, status=code)
+            return None
+        if not length:
+            return {}
+        body = bytearray(length)
+        if self.rfile.readinto(body) < length:
+            self.close_connection = True
+            return None
+        try:
+            data = loads_bytes(body)
+        except ValueError:  # json and orjson decode errors are both ValueErrors
+            data = None
+        if not isinstance(data, dict):
+            self.send_json({"ok": False, "error": "Body must be a JSON object"}, status=400)
+            return None
+        return data
+
+    def send_empty(self, code: int, headers=None):
+        self.send_response(code)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if code != 304:
+            self.send_header("Content-Length", "0")
+        self.end_headers()
 
-        elif self.path == "/api/stage":
-            length = int(self.headers.get("Content-Length", 0))
-            body = json.loads(self.rfile.read(length)) if length else {}
-            result = update_stage(
-                body.get("search", ""),
-                body.get("stage", ""),
-                body.get("url", ""),
-                body.get("company", ""),
-                body.get("title", ""),
-            )
-            self.send_json(result)
-
-        elif self.path == "/api/add-job":
-            length = int(self.headers.get("Content-Length", 0))
-            body = json.loads(self.rfile.read(length)) if length else {}
-            result = add_job(body.get("url", ""), body.get("destination", "queue"))
-            self.send_json(result)
+    def not_modified(self, etag: str, modified: float) -> bool:
+        """Whether the client's cached copy is current (If-None-Match wins over If-Modified-Since)."""
+        if "If-None-Match" in self.headers:
+            return etag in self.headers["If-None-Match"]
+        since = self.headers.get("If-Modified-Since")
+        if not since:
+            return False
+        try:
+            return int(modified) <= parsedate_to_datetime(since).timestamp()
+        except (TypeError, ValueError):
+            return False
+
+    def content_coding(self):
+        """The preferred content-coding the client accepts, or None."""
+        accepted = self.headers.get("Accept-Encoding", "")
+        for coding in CONTENT_CODINGS:
+            if coding in accepted:
+                return coding
+        return None
+
+    def send_json(self, data, headers=None, status: int = 200):
+        self.send_body(dumps_bytes(data), "application/json", headers, status=status)
+
+    def send_body(self, body: bytes, content_type: str, headers=None, encoded=None, status: int = 200):
+        """Send a response with body, compressed if the client accepts it.
+
+        encoded caches compressed copies of a body that is sent repeatedly, by
+        content-coding; missing codings are compressed once and added to it.
+        """
+        coding = self.content_coding() if len(body) >= GZIP_MIN_BYTES else None
+        if coding is not None:
+            if encoded is None:
+                body = compress(body, coding)
+            else:
+                if coding not in encoded:
+                    encoded[coding] = compress(body, coding, cached=True)
+                body = encoded[coding]
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        if coding is not None:
+            self.send_header("Content-Encoding", coding)
+        self.send_header("Vary", "Accept-Encoding")
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
 
-        elif self.path == "/api/delete-job":
-            length = int(self.headers.get("Content-Length", 0))
-            body = json.loads(self.rfile.read(length)) if length else {}
-            result = delete_from_queue(body.get("url", ""), body.get("company", ""), body.get("title", ""))
-            self.send_json(result)
 
-        elif self.path == "/api/skip-list/add":
-            length = int(self.headers.get("Content-Length", 0))
-            body = json.loads(self.rfile.read(length)) if length else {}
-            result = add_to_skip_list(body.get("name", ""), body.get("reason", ""), body.get("category", "manual"))
-            self.send_json(result)
+    # Path -> handler(self, url). Routes are looked up on the path alone.
+    GET_ROUTES = {
+        "/": get_page,
+        "/index.html": get_page,
+        "/api/data": get_data,
+        "/api/summary": get_summary,
+        "/api/stream": stream_data,
+    }
 
-        elif self.path == "/api/skip-list/remove":
-            length = int(self.headers.get("Content-Length", 0))
-            body = json.loads(self.rfile.read(length)) if length else {}
-            result = remove_from_skip_list(body.get("name", ""))
-            self.send_json(result)
-        else:
-            self.send_response(404)
-            self.end_headers()
+    # Path -> function of the parsed JSON body returning the JSON reply.
+    POST_ROUTES = {
+        "/api/mark-applied": lambda b: mark_as_applied(b.get("url", ""), b.get("company", ""), b.get("title", "")),
+        "/api/stage": lambda b: update_stage(b.get("search", ""), b.get("stage", ""), b.get("url", ""),
+                                             b.get("company", ""), b.get("title", "")),
+        "/api/add-job": lambda b: add_job(b.get("url", ""), b.get("destination", "queue")),
+        "/api/delete-job": lambda b: delete_from_queue(b.get("url", ""), b.get("company", ""), b.get("title", "")),
+        "/api/skip-list/add": lambda b: add_to_skip_list(b.get("name", ""), b.get("reason", ""),
+                                                         b.get("category", "manual")),
+        "/api/skip-list/remove": lambda b: remove_from_skip_list(b.get("name", "")),
+    }
 
-    def send_json(self, data):
-        self.send_response(200)
-        self.send_header("Content-Type", "application/json")
-        self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+
+class DashboardServer(http.server.ThreadingHTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
 
 
 if __name__ == "__main__":
-    server = http.server.HTTPServer(("127.0.0.1", PORT), DashboardHandler)
+    server = DashboardServer(("127.0.0.1", PORT), DashboardHandler)
     print(f"\n  Job Search Dashboard v3 running at http://localhost:{PORT}")
     print(f"  Workspace: {WORKSPACE}")
     print(f"  Press Ctrl+C to stop\n")
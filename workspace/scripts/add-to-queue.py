@@ -4,6 +4,12 @@ Add a job to the PENDING section of job-queue.md and maintain sort order.
 
 Usage:
   python3 scripts/add-to-queue.py '<JSON>'
+  python3 scripts/add-to-queue.py '[<JSON>, <JSON>, ...]'
+  python3 scripts/add-to-queue.py --stdin < jobs.ndjson   (NDJSON or a JSON array)
+
+  A batch is checked against the queue and against itself, then written in
+  one pass; each job still gets its own output line. Items that aren't valid
+  JSON objects get an ERROR line and are skipped, and the exit status is 1.
 
   JSON format:
   {
@@ -31,7 +37,8 @@ import os
 import json
 import re
 import fcntl
-from datetime import datetime
+
+from queue_utils import normalize_job_url
 
 WORKSPACE = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 QUEUE_PATH = os.path.join(WORKSPACE, 'job-queue.md')
@@ -50,71 +57,110 @@ def load_skip_companies():
 
 SKIP_COMPANIES = load_skip_companies()
 
-def parse_queue():
-    """Parse queue into sections: preamble, do_not_apply, in_progress, pending entries."""
-    with open(QUEUE_PATH, 'r') as f:
-        content = f.read()
+# "### [score] Company — Title" and "- **URL:** ..." lines of a pending entry
+HEADER_RE = re.compile(r'### \[(\d+)\]\s*(?:(.*?)\s+—\s+(.*))?')
+URL_RE = re.compile(r'- \*\*URL:\*\*\s*(\S+)')
+
+# Punctuation, spacing and case differences don't make a different posting
+KEY_STRIP_RE = re.compile(r'[\W_]+')
+
+def ct_key(company, title):
+    """Dedup key for a company + title pair.
+
+    "Acme, Inc. — Sr. Engineer (ML)" and "Acme Inc — Sr Engineer ML" share a key.
+    """
+    return f"{KEY_STRIP_RE.sub('', company.lower())}|{KEY_STRIP_RE.sub('', title.lower())}"
+
+PENDING_HEADER = '## PENDING (sorted by priority score, highest first)'
 
-    # Split by entry headers
-    lines = content.split('\n')
+def is_section_header(stripped):
+    """Whether a stripped line starts one of the queue sections."""
+    return (stripped.startswith(('## ⛔ DO NOT AUTO-APPLY', '## DO NOT AUTO-APPLY', '## PENDING'))
+            or stripped == '## IN PROGRESS')
 
-    preamble = []
-    do_not_apply = []
-    in_progress = []
-    pending_entries = []  # list of (score, text_block)
+def index_queue(content):
+    """Locate the PENDING section of the queue and index its entries.
 
-    current_section = 'preamble'
-    current_entry = []
-    current_score = 0
+    Returns a dict with:
+      preamble_end  offset of the first section header (the stats line lives before it)
+      pending_end   offset where the PENDING section ends, None if there is none
+      headers       (score, offset) of each pending "### [score]" line, in file order
+      urls, ct      the pending entries' normalized URLs and company+title keys
+    """
+    queue = {'preamble_end': None, 'pending_end': None, 'headers': [], 'urls': set(), 'ct': set()}
+    in_pending = False
+    offset = 0
 
-    for line in lines:
+    for line in content.split('\n'):
         stripped = line.strip()
 
-        if stripped.startswith('## ⛔ DO NOT AUTO-APPLY') or stripped.startswith('## DO NOT AUTO-APPLY'):
-            current_section = 'do_not_apply'
-            do_not_apply.append(line)
-            continue
-        elif stripped == '## IN PROGRESS':
-            current_section = 'in_progress'
-            in_progress.append(line)
-            continue
-        elif stripped.startswith('## PENDING'):
-            current_section = 'pending'
-            # Don't store the header — we'll regenerate it
-            continue
-
-        if current_section == 'preamble':
-            preamble.append(line)
-        elif current_section == 'do_not_apply':
-            do_not_apply.append(line)
-        elif current_section == 'in_progress':
+        if is_section_header(stripped):
+            if queue['preamble_end'] is None:
+                queue['preamble_end'] = offset
+            if in_pending:
+                queue['pending_end'] = offset
+            in_pending = stripped.startswith('## PENDING')
+            if in_pending:
+                queue['pending_end'] = None
+        elif in_pending:
             if stripped.startswith('### ['):
-                current_section = 'in_progress_entry'
-                in_progress.append(line)
+                # Extract score, company and title
+                m = HEADER_RE.match(stripped)
+                queue['headers'].append((int(m.group(1)) if m else 0, offset))
+                if m and m.group(2) is not None:
+                    queue['ct'].add(ct_key(m.group(2), m.group(3)))
             else:
-                in_progress.append(line)
-        elif current_section == 'in_progress_entry':
-            in_progress.append(line)
-        elif current_section == 'pending':
-            if stripped.startswith('### ['):
-                # Save previous entry
-                if current_entry:
-                    pending_entries.append((current_score, '\n'.join(current_entry)))
-                current_entry = [line]
-                # Extract score
-                m = re.match(r'### \[(\d+)\]', stripped)
-                current_score = int(m.group(1)) if m else 0
-            else:
-                current_entry.append(line)
-
-    # Save last entry
-    if current_entry:
-        pending_entries.append((current_score, '\n'.join(current_entry)))
-
-    return preamble, do_not_apply, in_progress, pending_entries
+                m = URL_RE.match(stripped)
+                if m:
+                    queue['urls'].add(normalize_job_url(m.group(1)))
+
+        offset += len(line) + 1
+
+    if queue['preamble_end'] is None:
+        queue['preamble_end'] = len(content)
+    if in_pending:
+        queue['pending_end'] = len(content)
+    return queue
+
+def blank_line_before(content, offset):
+    """Newlines needed so that text inserted at offset starts after a blank line."""
+    if offset == 0:
+        return ''
+    trailing = 0
+    while trailing < min(2, offset) and content[offset - 1 - trailing] == '\n':
+        trailing += 1
+    return '\n' * (2 - trailing)
+
+def insert_entries(content, queue, entries):
+    """Splice (score, block) entries into the PENDING section, keeping it sorted.
+
+    Each block goes right before the first pending entry with a lower score
+    (after any with the same score); existing entries are left untouched.
+    """
+    if queue['pending_end'] is None:
+        content += blank_line_before(content, len(content)) + PENDING_HEADER + '\n\n'
+        queue = dict(queue, pending_end=len(content), headers=[])
+
+    inserts = {}  # offset -> blocks to insert there, highest score first
+    for score, block in sorted(entries, key=lambda e: e[0], reverse=True):
+        offset = next((o for s, o in queue['headers'] if s < score), queue['pending_end'])
+        inserts.setdefault(offset, []).append(block + '\n\n')
+
+    out = []
+    prev = 0
+    for offset in sorted(inserts):
+        out.append(content[prev:offset])
+        out.append(blank_line_before(content, offset))
+        out.extend(inserts[offset])
+        prev = offset
+    out.append(content[prev:])
+    return ''.join(out)
 
 def build_entry(job):
     """Build a queue entry markdown block from job JSON."""
+    # Imported here so DUPLICATE/SKIPPED runs never load datetime
+    from datetime import datetime
+
     score = job.get('score', 0)
     company = job.get('company', 'Unknown')
     title = job.get('title', 'Unknown')
@@ -152,101 +198,162 @@ def build_entry(job):
 
     return '\n'.join(lines)
 
-def check_duplicate(url, company, title, pending_entries):
-    """Check if job already exists in pending entries."""
-    url_lower = url.lower()
-    ct_lower = f"{company.lower()}|{title.lower()}"
+def check_duplicate(url, company, title, pending_urls, pending_ct):
+    """Check if job already exists in pending entries (by URL or company+title)."""
+    return normalize_job_url(url) in pending_urls or ct_key(company, title) in pending_ct
 
-    for _, block in pending_entries:
-        if url_lower in block.lower():
-            return True
-        # Check company+title combo
-        block_lower = block.lower()
-        if company.lower() in block_lower and title.lower() in block_lower:
-            return True
-    return False
+# Reject internships, contractors, part-time, and non-engineering roles
+EXCLUDE_RE = re.compile(r'\b(intern|internship|contractor|contract|part[\s-]?time)\b', re.IGNORECASE)
+NON_ENG_RE = re.compile(r'\b(product manager|program manager|product designer|ux designer|graphic designer|content writer|copywriter|recruiter|talent acquisition|account executive|sales engineer|customer success|compliance|trust & safety operations|field safety|ehs|hse|clinical research|physician(?! ai)|nurse|facilities manager)\b', re.IGNORECASE)
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 add-to-queue.py '<JSON>'")
-        sys.exit(1)
-
-    try:
-        job = json.loads(sys.argv[1])
-    except json.JSONDecodeError as e:
-        print(f"ERROR: Invalid JSON: {e}")
-        sys.exit(1)
+def screen_job(job):
+    """Return a SKIPPED line if the job shouldn't be queued, else None.
 
+    Jobs at skip-list companies are queued with autoApply turned off.
+    """
     company = job.get('company', '')
     title = job.get('title', '')
-    url = job.get('url', '')
-    score = job.get('score', 0)
-
-    # Reject internships, contractors, part-time, and non-engineering roles
-    EXCLUDE_RE = re.compile(r'\b(intern|internship|contractor|contract|part[\s-]?time)\b', re.IGNORECASE)
-    NON_ENG_RE = re.compile(r'\b(product manager|program manager|product designer|ux designer|graphic designer|content writer|copywriter|recruiter|talent acquisition|account executive|sales engineer|customer success|compliance|trust & safety operations|field safety|ehs|hse|clinical research|physician(?! ai)|nurse|facilities manager)\b', re.IGNORECASE)
     if EXCLUDE_RE.search(title):
-        print(f"SKIPPED — {company} — {title} (not full-time)")
-        sys.exit(0)
+        return f"SKIPPED — {company} — {title} (not full-time)"
     if NON_ENG_RE.search(title):
-        print(f"SKIPPED — {company} — {title} (non-engineering role)")
-        sys.exit(0)
+        return f"SKIPPED — {company} — {title} (non-engineering role)"
 
     # Check skip companies
     if company.lower() in SKIP_COMPANIES and job.get('autoApply', True):
         job['autoApply'] = False
+    return None
+
+def read_batch(text):
+    """Parse a JSON array or NDJSON into (jobs, error lines).
+
+    Items that aren't JSON objects are reported and left out.
+    """
+    jobs, errors = [], []
+    if text.lstrip().startswith('['):
+        try:
+            items = json.loads(text)
+        except json.JSONDecodeError as e:
+            return [], [f"ERROR: Invalid JSON: {e}"]
+        numbered = [(f"item {n}", item) for n, item in enumerate(items, 1)]
+    else:
+        numbered = []
+        for n, line in enumerate(text.splitlines(), 1):
+            if not line.strip():
+                continue
+            try:
+                numbered.append((f"line {n}", json.loads(line)))
+            except json.JSONDecodeError as e:
+                errors.append(f"ERROR: Invalid JSON on line {n}: {e}")
+    for where, job in numbered:
+        if isinstance(job, dict):
+            jobs.append(job)
+        else:
+            errors.append(f"ERROR: Not a JSON object on {where}")
+    return jobs, errors
+
+def add_jobs(jobs):
+    """Add jobs to the queue under the queue lock, writing the file once.
 
+    Prints an ADDED or DUPLICATE line per job once the queue is written.
+    """
     LOCK_PATH = os.path.join(WORKSPACE, '.queue.lock')
     with open(LOCK_PATH, 'w') as lockf:
         fcntl.flock(lockf, fcntl.LOCK_EX)
         try:
-            # Parse current queue (inside lock so we see latest state)
-            preamble, do_not_apply, in_progress, pending_entries = parse_queue()
-
-            # Check duplicate
-            if check_duplicate(url, company, title, pending_entries):
-                print(f"DUPLICATE — {company} — {title} already in queue")
-                return
-
-            # Build new entry
-            new_entry = build_entry(job)
-            pending_entries.append((score, new_entry))
-
-            # Sort by score descending
-            pending_entries.sort(key=lambda x: x[0], reverse=True)
-
-            # Count pending
-            pending_count = len(pending_entries)
-
-            # Update stats in preamble
-            preamble_text = '\n'.join(preamble)
-            preamble_text = re.sub(
-                r'Pending: \d+',
-                f'Pending: {pending_count}',
-                preamble_text
-            )
-            now_str = datetime.now().strftime('%Y-%m-%d %H:%M CT')
-            preamble_text = re.sub(
-                r'Last Search: .*',
-                f'Last Search: {now_str}',
-                preamble_text
-            )
-
-            # Rebuild queue file
-            output = preamble_text + '\n'
-            output += '\n'.join(do_not_apply) + '\n'
-            output += '\n'.join(in_progress) + '\n'
-            output += '\n## PENDING (sorted by priority score, highest first)\n\n'
-
-            for _, block in pending_entries:
-                output += block + '\n\n'
-
-            with open(QUEUE_PATH, 'w') as f:
-                f.write(output)
-
-            print(f"ADDED [{score}] {company} — {title} ({pending_count} pending)")
+            # Index current queue (inside lock so we see latest state)
+            with open(QUEUE_PATH, 'r') as f:
+                content = f.read()
+            queue = index_queue(content)
+
+            entries = []
+            results = []
+            for job in jobs:
+                company = job.get('company', '')
+                title = job.get('title', '')
+                url = job.get('url', '')
+                score = job.get('score', 0)
+
+                # Check duplicate (against the queue and earlier jobs in this batch)
+                if check_duplicate(url, company, title, queue['urls'], queue['ct']):
+                    results.append(f"DUPLICATE — {company} — {title} already in queue")
+                    continue
+                if url:
+                    queue['urls'].add(normalize_job_url(url))
+                queue['ct'].add(ct_key(company, title))
+
+                entries.append((score, build_entry(job)))
+                pending_count = len(queue['headers']) + len(entries)
+                results.append(f"ADDED [{score}] {company} — {title} ({pending_count} pending)")
+
+            if entries:
+                write_entries(content, queue, entries)
+            for line in results:
+                print(line)
         finally:
             fcntl.flock(lockf, fcntl.LOCK_UN)
 
+def write_entries(content, queue, entries):
+    """Insert entries into the indexed queue content, update its stats and write it."""
+    from datetime import datetime
+
+    # Insert the new entries in score order
+    content = insert_entries(content, queue, entries)
+    pending_count = len(queue['headers']) + len(entries)
+
+    # Update stats in preamble
+    preamble_end = queue['preamble_end']
+    preamble_text = re.sub(
+        r'Pending: \d+',
+        f'Pending: {pending_count}',
+        content[:preamble_end]
+    )
+    now_str = datetime.now().strftime('%Y-%m-%d %H:%M CT')
+    preamble_text = re.sub(
+        r'Last Search: .*',
+        f'Last Search: {now_str}',
+        preamble_text
+    )
+
+    with open(QUEUE_PATH, 'w') as f:
+        f.write(preamble_text + content[preamble_end:])
+
+def main():
+    if len(sys.argv) < 2:
+        print("Usage: python3 add-to-queue.py '<JSON>' | '[<JSON>, ...]' | --stdin")
+        sys.exit(1)
+
+    if sys.argv[1] == '--stdin' or sys.argv[1].lstrip().startswith('['):
+        text = sys.stdin.read() if sys.argv[1] == '--stdin' else sys.argv[1]
+        jobs, errors = read_batch(text)
+        for line in errors:
+            print(line)
+        batch = []
+        for job in jobs:
+            skipped = screen_job(job)
+            if skipped:
+                print(skipped)
+            else:
+                batch.append(job)
+        if batch:
+            add_jobs(batch)
+        if errors:
+            sys.exit(1)
+        return
+
+    try:
+        job = json.loads(sys.argv[1])
+    except json.JSONDecodeError as e:
+        print(f"ERROR: Invalid JSON: {e}")
+        sys.exit(1)
+    if not isinstance(job, dict):
+        print("ERROR: Not a JSON object")
+        sys.exit(1)
+
+    skipped = screen_job(job)
+    if skipped:
+        print(skipped)
+        sys.exit(0)
+    add_jobs([job])
+
 if __name__ == '__main__':
     main()
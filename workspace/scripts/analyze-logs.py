@@ -21,6 +21,14 @@ import re
 import datetime
 from collections import defaultdict
 
+try:
+    import orjson
+except ImportError:  # optional: pip install orjson for faster log parsing
+    orjson = None
+
+# Both raise ValueError subclasses on malformed lines.
+loads = orjson.loads if orjson is not None else json.loads
+
 WORKSPACE = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 OPENCLAW_DIR = os.path.expanduser("~/.openclaw")
 APP_LOG = os.path.join(WORKSPACE, "logs", "applications.jsonl")
@@ -28,6 +36,10 @@ RUNS_FILE = os.path.join(OPENCLAW_DIR, "subagents", "runs.json")
 SESSIONS_DIR = os.path.join(OPENCLAW_DIR, "agents", "main", "sessions")
 ANALYSIS_DIR = os.path.join(WORKSPACE, "analysis")
 
+APPLY_TASK_RE = re.compile(r"Apply up to \d+ (\w+) jobs")
+ORPHAN_TIMEOUT_RE = re.compile(r"orphan-heartbeat-timeout-(\d+)s")
+BROWSER_UNREACHABLE = "Can't reach the OpenClaw browser control service"
+
 
 def load_app_log(since_dt=None):
     """Load structured application log entries."""
@@ -37,10 +49,12 @@ def load_app_log(since_dt=None):
     with open(APP_LOG) as f:
         for line in f:
             line = line.strip()
-            if not line:
+            # Blank or plain-text lines can't be entries; skip them without
+            # paying for a raised decode error.
+            if not line.startswith("{"):
                 continue
             try:
-                e = json.loads(line)
+                e = loads(line)
                 if since_dt:
                     ts = datetime.datetime.fromisoformat(e.get("ts", "").replace("Z", "+00:00"))
                     if ts < since_dt:
@@ -137,56 +151,65 @@ def scan_recent_sessions(since_dt=None, max_sessions=20):
                 continue
         try:
             with open(fpath) as f:
-                lines = f.readlines()
-
-            # Get session ID and start time from first line
-            first = json.loads(lines[0]) if lines else {}
-            session_id = first.get("id", os.path.basename(fpath).replace(".jsonl", ""))
-            session_ts = first.get("timestamp", "")
-
-            # Find initial prompt (task type)
-            task_label = ""
-            browser_errors = 0
-            browser_timeouts = 0
-            last_action = ""
-
-            for line in lines:
-                try:
-                    ev = json.loads(line)
-                    msg = ev.get("message", {})
-                    content = msg.get("content", "")
-                    if isinstance(content, list):
-                        for c in content:
-                            if not isinstance(c, dict):
-                                continue
-                            text = c.get("text", "")
-                            if not task_label and text and "Apply up to" in text:
-                                # Extract ATS type from first line
-                                m = re.search(r"Apply up to \d+ (\w+) jobs", text)
-                                if m:
-                                    task_label = m.group(1).lower()
-                            if c.get("type") == "tool_result":
-                                res = c.get("content", "")
-                                if isinstance(res, list):
-                                    for r in res:
-                                        if isinstance(r, dict):
-                                            t = r.get("text", "")
-                                            if "Can't reach the OpenClaw browser control service" in t:
-                                                browser_errors += 1
-                                            if "timed out after" in t.lower():
-                                                browser_timeouts += 1
-                                            if t.strip():
-                                                last_action = t.strip()[:100]
-                            if c.get("type") == "text" and c.get("text"):
-                                last_action = c["text"].strip()[:100]
-                except Exception:
-                    pass
+                first_line = f.readline()
+
+                # Get session ID and start time from first line
+                first = loads(first_line) if first_line else {}
+                session_id = first.get("id", os.path.basename(fpath).replace(".jsonl", ""))
+                session_ts = first.get("timestamp", "")
+
+                # Find initial prompt (task type)
+                task_label = ""
+                browser_errors = 0
+                browser_timeouts = 0
+                last_action = ""
+                events = 0
+
+                # Stream the transcript rather than holding it all in memory;
+                # the first line is counted and scanned like any other.
+                f.seek(0)
+                for line in f:
+                    events += 1
+                    if line[:1] != "{":
+                        continue
+                    try:
+                        ev = loads(line)
+                        msg = ev.get("message", {})
+                        content = msg.get("content", "")
+                        if isinstance(content, list):
+                            for c in content:
+                                if not isinstance(c, dict):
+                                    continue
+                                ctype = c.get("type")
+                                text = c.get("text", "")
+                                if not task_label and text and "Apply up to" in text:
+                                    # Extract ATS type from first line
+                                    m = APPLY_TASK_RE.search(text)
+                                    if m:
+                                        task_label = m.group(1).lower()
+                                if ctype == "tool_result":
+                                    res = c.get("content", "")
+                                    if isinstance(res, list):
+                                        for r in res:
+                                            if isinstance(r, dict):
+                                                t = r.get("text", "")
+                                                if BROWSER_UNREACHABLE in t:
+                                                    browser_errors += 1
+                                                if "timed out after" in t.lower():
+                                                    browser_timeouts += 1
+                                                t = t.strip()
+                                                if t:
+                                                    last_action = t[:100]
+                                if ctype == "text" and text:
+                                    last_action = text.strip()[:100]
+                    except Exception:
+                        pass
 
             results.append({
                 "session_id": session_id[:8],
                 "ts": session_ts[:19],
                 "ats": task_label or "?",
-                "events": len(lines),
+                "events": events,
                 "browser_errors": browser_errors,
                 "browser_timeouts": browser_timeouts,
                 "last_action": last_action,
@@ -264,8 +287,8 @@ def generate_report(hours, app_entries, runs, sessions):
         # Error breakdown
         orphan_runs = [r for r in runs if "orphan-heartbeat-timeout" in str(r.get("error", ""))]
         if orphan_runs:
-            timeouts = [int(re.search(r"orphan-heartbeat-timeout-(\d+)s", str(r["error"])).group(1))
-                        for r in orphan_runs if re.search(r"orphan-heartbeat-timeout-(\d+)s", str(r.get("error", "")))]
+            matches = (ORPHAN_TIMEOUT_RE.search(str(r["error"])) for r in orphan_runs)
+            timeouts = [int(m.group(1)) for m in matches if m]
             report.append(f"\n⚠️  **orphan-heartbeat-timeout**: {len(orphan_runs)} sessions killed")
             if timeouts:
                 report.append(f"   Timeout values: {sorted(timeouts, reverse=True)[:8]}")
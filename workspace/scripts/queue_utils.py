@@ -3,6 +3,7 @@
 
 import fcntl
 import re
+from urllib.parse import urlsplit
 
 ATS_PATTERNS = {
     "ashby": ["ashbyhq.com"],
@@ -11,6 +12,20 @@ ATS_PATTERNS = {
 }
 
 
+def normalize_job_url(url: str) -> str:
+    """Normalize a job URL for duplicate detection.
+
+    Case, scheme, a leading "www.", the fragment, trailing slashes and an
+    Ashby "/application" suffix don't make a different posting.
+    """
+    parts = urlsplit(url.strip().lower())
+    host = parts.netloc[4:] if parts.netloc.startswith("www.") else parts.netloc
+    path = parts.path.rstrip("/")
+    if path.endswith("/application"):
+        path = path[: -len("/application")]
+    return f"{host}{path}?{parts.query}" if parts.query else f"{host}{path}"
+
+
 def read_queue_content(queue_path: str, lock_path: str) -> str:
     """Read queue file under shared lock."""
     with open(lock_path, "w", encoding="utf-8") as lockf: